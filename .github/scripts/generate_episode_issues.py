@@ -6,12 +6,45 @@ This script processes the "50 Episodes in Relevance Realization" markdown files
 and creates GitHub issues for each episode, extracting key concepts and discussion points.
 """
 
+import io
 import os
 import re
 import json
+import threading
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to requests' json decoding
+    orjson = None
+
+# Patterns used while parsing episode markdown, compiled once at import time.
+# Capitalized words are matched singly and merged into phrases in Python, which
+# avoids backtracking through a repeated group on Title Case heavy text.
+CONCEPT_RE = re.compile(
+    r'(?P<word>\b[A-Z][a-z]+\b)'
+    r'|\*\*(?P<bold>[^*]+)\*\*'
+    r'|`(?P<code>[^`]+)`'
+)
+EPISODE_FILE_RE = re.compile(r'Episode_(\d{2,})\.md$')
+EPISODE_FILE_FORMAT = 'Episode_%02d.md'
+
+# Common sentence-initial words that are not concepts
+STOPWORDS = frozenset({'The', 'And', 'But', 'What', 'How', 'Why', 'This', 'That'})
+MAX_CONCEPTS = 10
+
+# Concurrent episode workers; kept small to stay under GitHub's secondary rate limits
+MAX_WORKERS = 4
+MAX_RATE_LIMIT_RETRIES = 3
+
+# ETags and titles of the issue list pages, kept between runs for conditional GETs
+ISSUE_CACHE_PATH = Path('.github') / '.episode_issues_cache.json'
 
 class EpisodeProcessor:
     """Processes episode markdown files and generates GitHub issues."""
@@ -30,6 +63,20 @@ class EpisodeProcessor:
             'Authorization': f'token {self.github_token}',
             'Accept': 'application/vnd.github.v3+json'
         }
+        
+        # Reuse one keep-alive connection pool for every GitHub API call
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        self.session.mount('https://', HTTPAdapter(pool_connections=1, pool_maxsize=2 * MAX_WORKERS, max_retries=retries))
+        
+        # Shared pause for all workers once GitHub asks us to back off
+        self._rate_limit_lock = threading.Lock()
+        self._rate_limited_until = 0.0
+        
+        # Titles of existing episode issues, fetched once on first use
+        self._existing_titles: Optional[Set[str]] = None
+        self.cache_path = Path(os.environ.get('ISSUE_CACHE_PATH', ISSUE_CACHE_PATH))
     
     def parse_episode_range(self) -> List[int]:
         """Parse the episode range input."""
@@ -44,21 +91,27 @@ class EpisodeProcessor:
     
     def extract_episode_content(self, file_path: Path) -> Dict[str, str]:
         """Extract structured content from an episode file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        title = None
+        sections = []
+        lines = []
         
-        # Extract title
-        title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
-        title = title_match.group(1) if title_match else f"Episode {file_path.stem.split('_')[1]}"
+        # Pick out the title and section headers in the same pass that reads the file
+        with open(file_path, 'r', encoding='utf-8', buffering=1 << 16) as f:
+            for line in f:
+                lines.append(line)
+                if line.startswith('## '):
+                    sections.append(line[3:].strip())
+                elif title is None and line.startswith('# '):
+                    title = line[2:].strip()
         
-        # Extract sections
-        sections = re.findall(r'^##\s+(.+)$', content, re.MULTILINE)
+        if not title:
+            title = f"Episode {file_path.stem.split('_')[1]}"
         
         # Extract key concepts (items that appear to be important topics)
-        concepts = self.extract_key_concepts(content)
+        concepts = self.extract_key_concepts(''.join(lines))
         
         # Extract a summary (first few paragraphs)
-        summary = self.extract_summary(content)
+        summary = self._summarize_lines(lines)
         
         return {
             'title': title,
@@ -70,33 +123,53 @@ class EpisodeProcessor:
     
     def extract_key_concepts(self, content: str) -> List[str]:
         """Extract key concepts from episode content."""
-        concepts = []
+        filtered_concepts = []
+        seen = set()
         
-        # Look for capitalized terms that might be concepts
-        concept_patterns = [
-            r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\b',  # Capitalized phrases
-            r'\*\*([^*]+)\*\*',  # Bold text
-            r'`([^`]+)`',  # Code/emphasis text
-        ]
+        # Filter and deduplicate capitalized terms, bold text and code spans as
+        # they are found, stopping at the first ten rather than matching the rest
+        for concept in self._iter_concepts(content):
+            if len(concept) > 3 and concept not in seen and concept not in STOPWORDS:
+                seen.add(concept)
+                filtered_concepts.append(concept)
+                if len(filtered_concepts) == MAX_CONCEPTS:  # Limit to top 10
+                    break
         
-        for pattern in concept_patterns:
-            matches = re.findall(pattern, content)
-            concepts.extend(matches)
+        return filtered_concepts
+    
+    def _iter_concepts(self, content: str) -> Iterable[str]:
+        """Yield candidate concepts in document order.
         
-        # Filter and deduplicate
-        filtered_concepts = []
-        for concept in concepts:
-            if (len(concept) > 3 and 
-                concept not in filtered_concepts and
-                concept not in ['The', 'And', 'But', 'What', 'How', 'Why', 'This', 'That']):
-                filtered_concepts.append(concept)
+        Runs of capitalized words separated only by whitespace are joined into
+        a single phrase, e.g. ``Relevance Realization``.
+        """
+        phrase_start = phrase_end = None
         
-        return filtered_concepts[:10]  # Limit to top 10
+        for match in CONCEPT_RE.finditer(content):
+            if match.lastgroup == 'word':
+                if phrase_end is not None and content[phrase_end:match.start()].isspace():
+                    phrase_end = match.end()
+                    continue
+                if phrase_end is not None:
+                    yield content[phrase_start:phrase_end]
+                phrase_start, phrase_end = match.span()
+                continue
+            
+            if phrase_end is not None:
+                yield content[phrase_start:phrase_end]
+                phrase_start = phrase_end = None
+            yield match.group(match.lastgroup)
+        
+        if phrase_end is not None:
+            yield content[phrase_start:phrase_end]
     
     def extract_summary(self, content: str) -> str:
         """Extract a summary from the episode content."""
-        # Remove header and get first few paragraphs
-        lines = content.split('\n')
+        # Iterate lines lazily; the summary usually ends within the first few lines
+        return self._summarize_lines(io.StringIO(content))
+    
+    def _summarize_lines(self, lines: Iterable[str]) -> str:
+        """Build a summary from the first paragraphs following a header."""
         summary_lines = []
         
         in_content = False
@@ -110,9 +183,9 @@ class EpisodeProcessor:
                 in_content = True
                 continue
             
-            if in_content and line and not line.startswith('#'):
+            if in_content and line:
                 summary_lines.append(line)
-                if line.endswith('.') or line.endswith('!') or line.endswith('?'):
+                if line.endswith(('.', '!', '?')):
                     paragraph_count += 1
                     if paragraph_count >= 2:  # First 2 paragraphs
                         break
@@ -130,13 +203,17 @@ class EpisodeProcessor:
             f"## File Location\n\n`{episode_data['file_path']}`\n"
         ]
         
+        # Append list items individually so the final join does all concatenation;
+        # the trailing empty part reproduces the blank line after each list
         if episode_data['sections']:
-            sections_list = '\n'.join([f"- {section}" for section in episode_data['sections']])
-            body_parts.append(f"## Key Sections\n\n{sections_list}\n")
+            body_parts.append("## Key Sections\n")
+            body_parts.extend(f"- {section}" for section in episode_data['sections'])
+            body_parts.append("")
         
         if episode_data['concepts']:
-            concepts_list = '\n'.join([f"- {concept}" for concept in episode_data['concepts']])
-            body_parts.append(f"## Key Concepts\n\n{concepts_list}\n")
+            body_parts.append("## Key Concepts\n")
+            body_parts.extend(f"- {concept}" for concept in episode_data['concepts'])
+            body_parts.append("")
         
         body_parts.extend([
             "## Discussion Points\n\n- [ ] Review episode content for implementation insights",
@@ -151,27 +228,88 @@ class EpisodeProcessor:
         
         return '\n'.join(body_parts)
     
-    def check_issue_exists(self, title: str) -> bool:
-        """Check if an issue with this title already exists."""
+    def _parse_json(self, data: bytes) -> Any:
+        """Decode a JSON response body, using orjson when it is installed."""
+        if orjson is not None:
+            return orjson.loads(data)
+        return json.loads(data)
+    
+    def _read_issue_cache(self) -> List[Dict[str, Any]]:
+        """Load the issue list pages cached by a previous run."""
+        try:
+            with open(self.cache_path, 'rb') as f:
+                return self._parse_json(f.read()).get('pages', [])
+        except (OSError, ValueError, AttributeError):
+            return []
+    
+    def _write_issue_cache(self, pages: List[Dict[str, Any]]):
+        """Persist issue list pages so the next run can revalidate them."""
+        try:
+            self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.cache_path, 'w', encoding='utf-8') as f:
+                json.dump({'pages': pages}, f)
+        except OSError as e:
+            print(f"Could not save issue cache: {e}")
+    
+    def _load_existing_titles(self) -> Set[str]:
+        """Fetch and cache the titles of all existing episode issues.
+        
+        Pages seen on a previous run are revalidated with If-None-Match; a 304
+        reuses the cached titles and does not count against the rate limit.
+        """
+        if self._existing_titles is not None:
+            return self._existing_titles
+        
         search_url = f"{self.github_api_base}/issues"
-        params = {
-            'state': 'all',
-            'labels': 'episode',
-            'per_page': 100
-        }
+        per_page = 100
+        cached_pages = self._read_issue_cache()
+        pages = []
+        titles = set()
+        page = 1
         
         try:
-            response = requests.get(search_url, headers=self.headers, params=params)
-            response.raise_for_status()
-            
-            issues = response.json()
-            for issue in issues:
-                if issue['title'].strip() == title.strip():
-                    return True
-            return False
+            while True:
+                params = {
+                    'state': 'all',
+                    'labels': 'episode',
+                    'per_page': per_page,
+                    'page': page
+                }
+                cached = cached_pages[page - 1] if page <= len(cached_pages) else None
+                headers = {'If-None-Match': cached['etag']} if cached and cached.get('etag') else None
+                
+                self._wait_for_rate_limit()
+                response = self.session.get(search_url, params=params, headers=headers)
+                self._respect_rate_limit(response)
+                
+                if response.status_code == 304 and cached:
+                    page_titles = cached['titles']
+                    etag = response.headers.get('ETag', cached['etag'])
+                else:
+                    data = response.content
+                    if not response.ok:
+                        print(f"Response: {data.decode('utf-8', 'replace')}")
+                        response.raise_for_status()
+                    page_titles = [issue['title'].strip() for issue in self._parse_json(data)]
+                    etag = response.headers.get('ETag')
+                
+                pages.append({'etag': etag, 'titles': page_titles})
+                titles.update(page_titles)
+                if len(page_titles) < per_page:
+                    break
+                page += 1
         except requests.RequestException as e:
+            # Leave the cache empty so the next lookup retries
             print(f"Error checking existing issues: {e}")
-            return False
+            return titles
+        
+        self._write_issue_cache(pages)
+        self._existing_titles = titles
+        return titles
+    
+    def check_issue_exists(self, title: str) -> bool:
+        """Check if an issue with this title already exists."""
+        return title.strip() in self._load_existing_titles()
     
     def create_github_issue(self, episode_data: Dict[str, str]) -> bool:
         """Create a GitHub issue for an episode."""
@@ -191,18 +329,72 @@ class EpisodeProcessor:
         url = f"{self.github_api_base}/issues"
         
         try:
-            response = requests.post(url, headers=self.headers, json=issue_data)
-            response.raise_for_status()
-            
-            issue = response.json()
-            print(f"Created issue #{issue['number']}: {title}")
-            return True
-            
+            response = self._post_with_rate_limit(url, issue_data)
         except requests.RequestException as e:
             print(f"Error creating issue for {title}: {e}")
-            if hasattr(e, 'response') and e.response:
-                print(f"Response: {e.response.text}")
             return False
+        
+        # Read the buffered body once and decode it for whichever path we take
+        data = response.content
+        if not response.ok:
+            print(f"Error creating issue for {title}: HTTP {response.status_code}")
+            print(f"Response: {data.decode('utf-8', 'replace')}")
+            return False
+        
+        issue = self._parse_json(data)
+        print(f"Created issue #{issue['number']}: {title}")
+        if self._existing_titles is not None:
+            self._existing_titles.add(title.strip())
+        return True
+    
+    def _wait_for_rate_limit(self):
+        """Block until any backoff requested by the API has elapsed."""
+        with self._rate_limit_lock:
+            delay = self._rate_limited_until - time.monotonic()
+        if delay > 0:
+            time.sleep(delay)
+    
+    def _respect_rate_limit(self, response: requests.Response):
+        """Pause all workers until the reset time once the primary rate limit is spent."""
+        if response.headers.get('X-RateLimit-Remaining') != '0':
+            return
+        delay = float(response.headers.get('X-RateLimit-Reset', 0)) - time.time()
+        if delay > 0:
+            print(f"Rate limit exhausted, pausing {delay:.0f}s until reset")
+            with self._rate_limit_lock:
+                self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+    
+    def _post_with_rate_limit(self, url: str, payload: Dict) -> requests.Response:
+        """POST to the API, waiting out rate-limit responses that carry Retry-After.
+        
+        The backoff is shared, so one throttled worker pauses the whole pool
+        rather than letting the others keep hitting the limit.
+        """
+        for _ in range(MAX_RATE_LIMIT_RETRIES):
+            self._wait_for_rate_limit()
+            response = self.session.post(url, json=payload)
+            self._respect_rate_limit(response)
+            if response.status_code not in (403, 429) or 'retry-after' not in response.headers:
+                return response
+            delay = float(response.headers['retry-after'])
+            print(f"Rate limited, retrying in {delay:.0f}s")
+            with self._rate_limit_lock:
+                self._rate_limited_until = max(self._rate_limited_until, time.monotonic() + delay)
+        return response
+    
+    def _process_one(self, episode_file: Path) -> str:
+        """Process a single episode file and return the result bucket it falls in."""
+        try:
+            print(f"Processing {episode_file}...")
+            episode_data = self.extract_episode_content(episode_file)
+            
+            if self.create_github_issue(episode_data):
+                return "created"
+            return "skipped"
+                
+        except Exception as e:
+            print(f"Error processing {episode_file}: {e}")
+            return "errors"
     
     def process_episodes(self) -> Dict[str, int]:
         """Process episodes and create issues."""
@@ -214,26 +406,33 @@ class EpisodeProcessor:
         episode_numbers = self.parse_episode_range()
         results = {"created": 0, "skipped": 0, "errors": 0}
         
+        # Fetch existing issue titles once instead of once per episode
+        self._load_existing_titles()
+        
+        # One directory scan instead of a stat() per requested episode
+        present = {}
+        with os.scandir(episodes_dir) as entries:
+            for entry in entries:
+                match = EPISODE_FILE_RE.match(entry.name)
+                if match and entry.is_file():
+                    present[int(match.group(1))] = Path(entry.path)
+        
+        episode_files = []
         for episode_num in episode_numbers:
-            episode_file = episodes_dir / f"Episode_{episode_num:02d}.md"
+            episode_file = present.get(episode_num)
             
-            if not episode_file.exists():
-                print(f"Episode file not found: {episode_file}")
+            if episode_file is None:
+                print(f"Episode file not found: {episodes_dir / (EPISODE_FILE_FORMAT % episode_num)}")
                 results["errors"] += 1
                 continue
             
-            try:
-                print(f"Processing {episode_file}...")
-                episode_data = self.extract_episode_content(episode_file)
-                
-                if self.create_github_issue(episode_data):
-                    results["created"] += 1
-                else:
-                    results["skipped"] += 1
-                    
-            except Exception as e:
-                print(f"Error processing {episode_file}: {e}")
-                results["errors"] += 1
+            episode_files.append(episode_file)
+        
+        # Issue creation is network-bound, so overlap requests across a few threads
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [executor.submit(self._process_one, path) for path in episode_files]
+            for future in as_completed(futures):
+                results[future.result()] += 1
         
         return results
 
@@ -6,6 +6,7 @@ CLI interface for VM-Daemon-Sys cognitive service orchestration.
 import argparse
 import asyncio
 import json
+import os
 import sys
 import time
 from pathlib import Path
@@ -14,6 +15,20 @@ from typing import Dict, Any
 from src.vm_daemon_sys.daemon import CognitiveDaemon
 from src.vm_daemon_sys.service_manager import ServiceType, ServiceStatus
 
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the stdlib encoder
+    orjson = None
+
+def _dumps(obj: Any) -> str:
+    """Pretty-print an object as JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    return json.dumps(obj, indent=2)
+
+# Polling period for `health --watch`
+HEALTH_REFRESH_INTERVAL = 5  # seconds
+
 class CognitiveCLI:
     """Command-line interface for cognitive daemon management."""
     
@@ -22,23 +37,11 @@ class CognitiveCLI:
     
     def run(self, args):
         """Run the CLI with given arguments."""
-        if args.command == 'start':
-            self.start_daemon(args)
-        elif args.command == 'stop':
-            self.stop_daemon(args)
-        elif args.command == 'status':
-            self.show_status(args)
-        elif args.command == 'services':
-            self.manage_services(args)
-        elif args.command == 'health':
-            self.show_health(args)
-        elif args.command == 'test':
-            self.test_processing(args)
-        elif args.command == 'config':
-            self.manage_config(args)
-        else:
+        handler = self.COMMANDS.get(args.command)
+        if handler is None:
             print(f"Unknown command: {args.command}")
             sys.exit(1)
+        handler(self, args)
     
     def start_daemon(self, args):
         """Start the cognitive daemon."""
@@ -81,24 +84,38 @@ class CognitiveCLI:
     
     def manage_services(self, args):
         """Manage individual services."""
-        if args.service_action == 'list':
-            self._list_services()
-        elif args.service_action == 'start':
-            self._start_service(args.service_name)
-        elif args.service_action == 'stop':
-            self._stop_service(args.service_name)
-        elif args.service_action == 'restart':
-            self._restart_service(args.service_name)
-        elif args.service_action == 'scale':
-            self._scale_service(args.service_name, args.instances)
+        handler = self.SERVICE_ACTIONS.get(args.service_action)
+        if handler:
+            handler(self, args)
     
     def show_health(self, args):
         """Show health status."""
         print("Health Status")
         print("=" * 50)
         
+        services_health = self._get_health_snapshot()
+        self._render_health(services_health)
+        
+        if args.watch:
+            print("\nWatching health status (Ctrl+C to exit)...")
+            try:
+                while True:
+                    time.sleep(HEALTH_REFRESH_INTERVAL)
+                    
+                    # Redraw only on change; the snapshot is still mock data, so
+                    # nothing redraws until it is read from a running daemon
+                    latest = self._get_health_snapshot()
+                    if latest != services_health:
+                        services_health = latest
+                        print()
+                        self._render_health(services_health)
+            except KeyboardInterrupt:
+                print("\nStopped watching.")
+    
+    def _get_health_snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Get the current per-service health data."""
         # Mock health data
-        services_health = {
+        return {
             'relevance': {'status': 'healthy', 'cpu': 45.2, 'memory': 62.1, 'response_time': 125},
             'wisdom': {'status': 'healthy', 'cpu': 38.7, 'memory': 55.8, 'response_time': 89},
             'rationality': {'status': 'warning', 'cpu': 72.1, 'memory': 43.2, 'response_time': 156},
@@ -107,19 +124,12 @@ class CognitiveCLI:
             'integration': {'status': 'healthy', 'cpu': 51.3, 'memory': 67.4, 'response_time': 203},
             'silicon_sage': {'status': 'healthy', 'cpu': 48.9, 'memory': 78.3, 'response_time': 167}
         }
-        
+    
+    def _render_health(self, services_health: Dict[str, Dict[str, Any]]):
+        """Print one line of health data per service."""
         for service, health in services_health.items():
             status_icon = "✅" if health['status'] == 'healthy' else "⚠️" if health['status'] == 'warning' else "❌"
             print(f"{status_icon} {service:<15} CPU: {health['cpu']:>5.1f}% Memory: {health['memory']:>5.1f}% Response: {health['response_time']:>3}ms")
-        
-        if args.watch:
-            print("\nWatching health status (Ctrl+C to exit)...")
-            try:
-                while True:
-                    time.sleep(5)
-                    # In real implementation, refresh the display
-            except KeyboardInterrupt:
-                print("\nStopped watching.")
     
     def test_processing(self, args):
         """Test cognitive processing."""
@@ -131,7 +141,7 @@ class CognitiveCLI:
         test_context = {"domain": "cognitive_enhancement", "complexity": "medium"}
         
         print(f"Input: {test_message}")
-        print(f"Context: {json.dumps(test_context, indent=2)}")
+        print(f"Context: {_dumps(test_context)}")
         
         # Simulate processing
         print("\nProcessing...")
@@ -158,17 +168,14 @@ class CognitiveCLI:
         }
         
         print("\nResponse:")
-        print(json.dumps(response, indent=2))
+        print(_dumps(response))
         print(f"\nProcessing completed in 2.1 seconds")
     
     def manage_config(self, args):
         """Manage configuration."""
-        if args.config_action == 'show':
-            self._show_config(args.config_file)
-        elif args.config_action == 'validate':
-            self._validate_config(args.config_file)
-        elif args.config_action == 'reload':
-            self._reload_config()
+        handler = self.CONFIG_ACTIONS.get(args.config_action)
+        if handler:
+            handler(self, args)
     
     def _show_detailed_status(self):
         """Show detailed service status."""
@@ -235,8 +242,28 @@ class CognitiveCLI:
         print(f"Configuration: {config_path}")
         print("=" * 50)
         
-        with open(config_path, 'r') as f:
-            print(f.read())
+        self._copy_to_stdout(config_path)
+        print()
+    
+    def _copy_to_stdout(self, path: Path):
+        """Write a file to stdout, letting the kernel copy it when possible."""
+        sys.stdout.flush()
+        
+        with open(path, 'rb') as f:
+            offset = 0
+            try:
+                out_fd = sys.stdout.fileno()
+                size = os.fstat(f.fileno()).st_size
+                while offset < size:
+                    sent = os.sendfile(out_fd, f.fileno(), offset, size - offset)
+                    if sent == 0:
+                        break
+                    offset += sent
+                return
+            except (AttributeError, OSError):
+                # No sendfile on this platform, or stdout is not a real file descriptor
+                f.seek(offset)
+                sys.stdout.write(f.read().decode('utf-8', 'replace'))
     
     def _validate_config(self, config_file):
         """Validate configuration file."""
@@ -255,6 +282,31 @@ class CognitiveCLI:
         print("Reloading configuration...")
         # Implementation would send signal to daemon
         print("Configuration reloaded successfully.")
+    
+    # Dispatch tables, built once when the class is defined
+    COMMANDS = {
+        'start': start_daemon,
+        'stop': stop_daemon,
+        'status': show_status,
+        'services': manage_services,
+        'health': show_health,
+        'test': test_processing,
+        'config': manage_config,
+    }
+    
+    SERVICE_ACTIONS = {
+        'list': lambda self, args: self._list_services(),
+        'start': lambda self, args: self._start_service(args.service_name),
+        'stop': lambda self, args: self._stop_service(args.service_name),
+        'restart': lambda self, args: self._restart_service(args.service_name),
+        'scale': lambda self, args: self._scale_service(args.service_name, args.instances),
+    }
+    
+    CONFIG_ACTIONS = {
+        'show': lambda self, args: self._show_config(args.config_file),
+        'validate': lambda self, args: self._validate_config(args.config_file),
+        'reload': lambda self, args: self._reload_config(),
+    }
 
 def main():
     """Main CLI entry point."""
@@ -1,5 +1,5 @@
 from enum import Enum
-from typing import Dict, List, Set, Tuple, Optional
+from typing import Dict, FrozenSet, List, Set, Tuple, Optional
 import numpy as np
 from dataclasses import dataclass
 
@@ -11,15 +11,50 @@ class RelevanceMode(Enum):
     SIDE_EFFECTS = "side_effects"  # Action consequences
     LONG_TERM_MEMORY = "long_term_memory"  # Organization & access
 
+# Fixed mode ordering and index lookup, shared by all cores
+_MODES = tuple(RelevanceMode)
+_MODE_INDEX: Dict[RelevanceMode, int] = {mode: i for i, mode in enumerate(_MODES)}
+_N_MODES = len(_MODES)
+
 @dataclass
 class MeaningCrisisIndicators:
     """Indicators of meaning crisis as defined in Episode 00"""
+    __slots__ = ('disconnection_level', 'bullshit_ratio', 'relevance_coherence',
+                 'transformation_resistance', 'historical_continuity')
     disconnection_level: float  # Self, others, world, future disconnection
     bullshit_ratio: float  # Proportion of low-quality information
     relevance_coherence: float  # Consistency of relevance judgments
     transformation_resistance: float  # Resistance to cognitive change
     historical_continuity: float  # Connection to wisdom traditions
 
+# Threshold on the weighted crisis score above which a crisis is detected
+CRISIS_THRESHOLD = 0.6
+
+def _crisis_score(disconnection: float, bullshit_ratio: float,
+                  coherence_loss: float, historical_disconnect: float) -> float:
+    """Weighted crisis score (based on Episode 00 emphasis)."""
+    return (0.3 * disconnection + 0.3 * bullshit_ratio
+            + 0.25 * coherence_loss + 0.15 * historical_disconnect)
+
+# Intervention suggestions, grouped by the crisis indicator they address
+_NO_CRISIS_SUGGESTIONS = ("Relevance realization functioning normally",)
+_DISCONNECTION_SUGGESTIONS = (
+    "Enhance cross-modal integration to reduce disconnection",
+    "Strengthen self-other-world-future connection patterns",
+)
+_BULLSHIT_SUGGESTIONS = (
+    "Activate truth-seeking (Aletheia) processes",
+    "Implement rigorous rational reflection protocols",
+)
+_COHERENCE_SUGGESTIONS = (
+    "Stabilize relevance judgment patterns",
+    "Engage in collaborative investigation processes",
+)
+_HISTORICAL_SUGGESTIONS = (
+    "Integrate wisdom traditions and historical resources",
+    "Activate psychotechnology integration protocols",
+)
+
 class RelevanceCore:
     """Core relevance realization system that implements Vervaeke's framework.
     
@@ -32,21 +67,29 @@ class RelevanceCore:
     def __init__(self):
         # Salience weights for different modes
         self.mode_weights: Dict[RelevanceMode, float] = {
-            mode: 1.0 for mode in RelevanceMode
+            mode: 1.0 for mode in _MODES
         }
         
         # Current active contents
-        self.active_contents: Dict[RelevanceMode, Set] = {
-            mode: set() for mode in RelevanceMode
+        self.active_contents: Dict[RelevanceMode, FrozenSet] = {
+            mode: frozenset() for mode in _MODES
         }
+        # Size of each mode's active contents, kept in step with active_contents
+        self._activation_counts = np.zeros(_N_MODES, dtype=np.int32)
         
         # Salience thresholds for filtering
         self.thresholds: Dict[RelevanceMode, float] = {
-            mode: 0.5 for mode in RelevanceMode
+            mode: 0.5 for mode in _MODES
         }
         
         # Interaction weights between modes
-        self.interaction_weights = np.ones((len(RelevanceMode), len(RelevanceMode)))
+        self.interaction_weights = np.ones((_N_MODES, _N_MODES), dtype=np.float32)
+        # Per-mode product of interaction weights with every other mode
+        self._mode_factor = np.ones(_N_MODES, dtype=np.float32)
+        self._recompute_mode_factors()
+        
+        # Per-core generator for placeholder salience draws
+        self._rng = np.random.default_rng()
         
         # Meaning crisis detection state
         self.crisis_indicators = MeaningCrisisIndicators(
@@ -58,11 +101,17 @@ class RelevanceCore:
         )
         
         # Historical patterns for stability analysis
-        self.relevance_history: List[float] = []
         self.coherence_window_size = 10
+        # Ring buffer of recent confidences: write index and filled count
+        self._hist = np.empty(self.coherence_window_size, dtype=np.float32)
+        self._hist_i = 0
+        self._hist_n = 0
+        # Running sum and sum of squares over the window for O(1) variance
+        self._hist_sum = 0.0
+        self._hist_sumsq = 0.0
         
     def update_salience(self, mode: RelevanceMode, contents: Set, 
-                       context: Optional[Dict] = None) -> Set:
+                       context: Optional[Dict] = None) -> FrozenSet:
         """Update salience weights for given contents in a mode.
         
         Args:
@@ -71,48 +120,48 @@ class RelevanceCore:
             context: Optional contextual information
             
         Returns:
-            Set of items above salience threshold
+            Frozen set of items above salience threshold
         """
-        # Get base salience for contents
-        salience = self._compute_base_salience(contents, context)
-        
-        # Modulate by mode interactions
-        for other_mode in RelevanceMode:
-            if other_mode != mode:
-                mode_idx = list(RelevanceMode).index(mode)
-                other_idx = list(RelevanceMode).index(other_mode)
-                interaction_weight = self.interaction_weights[mode_idx, other_idx]
-                other_contents = self.active_contents[other_mode]
-                salience = self._modulate_salience(
-                    salience, other_contents, interaction_weight
-                )
+        # Get base salience for contents as parallel item/weight arrays
+        items, salience = self._compute_base_salience(contents, context)
+        return self._update_mode_salience(mode, items, salience)
+    
+    def _update_mode_salience(self, mode: RelevanceMode, items: np.ndarray,
+                              salience: np.ndarray) -> FrozenSet:
+        """Modulate and filter precomputed base salience for one mode."""
+        # Modulate by mode interactions. Modulation is a pure scaling by each
+        # other mode's interaction weight, so the chain of scalings collapses
+        # into one multiply by the cached product of those weights.
+        mode_idx = _MODE_INDEX[mode]
+        salience = salience * self._mode_factor[mode_idx]
                 
         # Filter by threshold
         threshold = self.thresholds[mode]
-        salient_items = {
-            item for item, weight in salience.items() 
-            if weight >= threshold
-        }
+        salient_items = frozenset(items[salience >= threshold].tolist())
         
-        # Update active contents
+        # Update active contents with an immutable snapshot
         self.active_contents[mode] = salient_items
+        self._activation_counts[mode_idx] = len(salient_items)
         
         return salient_items
     
+    @property
+    def relevance_history(self) -> List[float]:
+        """Recent relevance confidences, oldest first."""
+        if self._hist_n < self.coherence_window_size:
+            return self._hist[:self._hist_n].tolist()
+        return np.roll(self._hist, -self._hist_i).tolist()
+    
     def _compute_base_salience(self, contents: Set, 
-                             context: Optional[Dict]) -> Dict:
-        """Compute base salience weights for contents."""
+                             context: Optional[Dict]) -> Tuple[np.ndarray, np.ndarray]:
+        """Compute base salience weights for contents.
+        
+        Returns the items as an object array alongside a float32 array of
+        their weights, so modulation and filtering operate on whole arrays.
+        """
         # Placeholder for more sophisticated salience computation
-        return {item: np.random.random() for item in contents}
-        
-    def _modulate_salience(self, salience: Dict, other_contents: Set,
-                          interaction_weight: float) -> Dict:
-        """Modulate salience based on contents in other modes."""
-        # Placeholder for more sophisticated interaction
-        return {
-            k: v * interaction_weight 
-            for k, v in salience.items()
-        }
+        items = np.fromiter(contents, dtype=object, count=len(contents))
+        return items, self._rng.random(len(items), dtype=np.float32)
         
     def restructure_salience(self, mode: RelevanceMode,
                            new_context: Dict) -> None:
@@ -123,36 +172,64 @@ class RelevanceCore:
         # Update thresholds based on context
         self.thresholds[mode] *= new_context.get('threshold_mod', 1.0)
         
-        # Update interaction weights
-        for other_mode in RelevanceMode:
-            if other_mode != mode:
-                mode_idx = list(RelevanceMode).index(mode)
-                other_idx = list(RelevanceMode).index(other_mode)
-                self.interaction_weights[mode_idx, other_idx] *= \
-                    new_context.get('interaction_mod', 1.0)
+        # Update interaction weights with every other mode
+        mode_idx = _MODE_INDEX[mode]
+        row = self.interaction_weights[mode_idx]
+        self_weight = row[mode_idx]
+        row *= new_context.get('interaction_mod', 1.0)
+        row[mode_idx] = self_weight
+        self._recompute_mode_factors()
                     
         # Re-evaluate active contents with new parameters
         self.update_salience(mode, self.active_contents[mode], new_context)
 
+    def _recompute_mode_factors(self) -> None:
+        """Refresh the cached per-mode interaction factors."""
+        rows = self.interaction_weights.copy()
+        np.fill_diagonal(rows, 1.0)
+        self._mode_factor = rows.prod(axis=1)
+
     def evaluate_relevance(self, query: Set, context: Dict) -> Tuple[Set, float]:
         """Evaluate relevance of query items in current context.
         
         Returns both relevant items and confidence score.
         """
+        # Base salience depends only on the query, so compute it once
+        items, base = self._compute_base_salience(query, context)
+        return self._evaluate_items(items, base, context)
+    
+    def evaluate_relevance_many(self, query: Set,
+                                contexts: List[Dict]) -> List[Tuple[Set, float]]:
+        """Evaluate the same query in each of several contexts, in order.
+        
+        Equivalent to calling evaluate_relevance once per context, but the
+        query is converted and its base salience drawn for every context in
+        a single step.
+        """
+        items = np.fromiter(query, dtype=object, count=len(query))
+        bases = self._rng.random((len(contexts), len(items)), dtype=np.float32)
+        return [self._evaluate_items(items, base, context)
+                for base, context in zip(bases, contexts)]
+    
+    def _evaluate_items(self, items: np.ndarray, base: np.ndarray,
+                        context: Dict) -> Tuple[Set, float]:
+        """Evaluate query items with precomputed base salience across all modes."""
         relevant_items = set()
         total_confidence = 0.0
         
+        query_size = len(items)
+        
         # Check relevance across all modes
-        for mode in RelevanceMode:
+        for mode in _MODES:
             # Update salience landscape
-            salient = self.update_salience(mode, query, context)
+            salient = self._update_mode_salience(mode, items, base)
             
             # Accumulate results
             relevant_items.update(salient)
-            total_confidence += len(salient) / len(query)
+            total_confidence += len(salient) / query_size
             
         # Normalize confidence
-        confidence = total_confidence / len(RelevanceMode)
+        confidence = total_confidence / _N_MODES
         
         # Update meaning crisis indicators
         self._update_crisis_indicators(confidence, context)
@@ -162,13 +239,21 @@ class RelevanceCore:
     def _update_crisis_indicators(self, confidence: float, context: Dict) -> None:
         """Update meaning crisis indicators based on Episode 00 framework."""
         # Track relevance coherence over time
-        self.relevance_history.append(confidence)
-        if len(self.relevance_history) > self.coherence_window_size:
-            self.relevance_history.pop(0)
+        x_new = float(np.float32(confidence))
+        if self._hist_n == self.coherence_window_size:
+            x_old = float(self._hist[self._hist_i])
+        else:
+            x_old = 0.0
+            self._hist_n += 1
+        self._hist[self._hist_i] = x_new
+        self._hist_i = (self._hist_i + 1) % self.coherence_window_size
+        self._hist_sum += x_new - x_old
+        self._hist_sumsq += x_new * x_new - x_old * x_old
             
         # Calculate coherence as stability of relevance judgments
-        if len(self.relevance_history) > 1:
-            coherence_variance = np.var(self.relevance_history)
+        if self._hist_n > 1:
+            mean = self._hist_sum / self._hist_n
+            coherence_variance = max(0.0, self._hist_sumsq / self._hist_n - mean * mean)
             self.crisis_indicators.relevance_coherence = max(0.0, 1.0 - coherence_variance)
         
         # Detect bullshit based on low-confidence, high-certainty claims
@@ -178,10 +263,9 @@ class RelevanceCore:
         self.crisis_indicators.bullshit_ratio = min(1.0, certainty_gap * 2.0)
         
         # Assess disconnection based on lack of cross-modal relevance
-        mode_activations = [len(contents) for contents in self.active_contents.values()]
-        if mode_activations:
-            activation_variance = np.var(mode_activations) / (np.mean(mode_activations) + 1e-6)
-            self.crisis_indicators.disconnection_level = min(1.0, activation_variance)
+        counts = self._activation_counts
+        activation_variance = float(counts.var() / (counts.mean() + 1e-6))
+        self.crisis_indicators.disconnection_level = min(1.0, activation_variance)
         
         # Historical continuity based on context connection to tradition
         tradition_markers = context.get('tradition_connection', 0.5)
@@ -202,41 +286,52 @@ class RelevanceCore:
             'historical_disconnect': 1.0 - self.crisis_indicators.historical_continuity
         }
         
-        # Weighted crisis score (based on Episode 00 emphasis)
-        weights = {
-            'disconnection': 0.3,
-            'bullshit_ratio': 0.3,
-            'coherence_loss': 0.25,
-            'historical_disconnect': 0.15
-        }
-        
-        crisis_score = sum(indicators[key] * weights[key] for key in indicators)
-        crisis_detected = crisis_score > 0.6  # Threshold based on severity
+        crisis_score = _crisis_score(
+            indicators['disconnection'],
+            indicators['bullshit_ratio'],
+            indicators['coherence_loss'],
+            indicators['historical_disconnect']
+        )
+        crisis_detected = crisis_score > CRISIS_THRESHOLD
         
         return crisis_detected, crisis_score, indicators
     
-    def get_crisis_intervention_suggestions(self) -> List[str]:
-        """Suggest interventions based on Episode 00 framework."""
-        crisis_detected, severity, indicators = self.detect_meaning_crisis()
-        suggestions = []
+    def get_crisis_intervention_suggestions(
+            self, indicators: Optional[Dict[str, float]] = None) -> List[str]:
+        """Suggest interventions based on Episode 00 framework.
+        
+        Args:
+            indicators: Indicator scores already returned by detect_meaning_crisis;
+                read from the current crisis indicators when omitted
+        """
+        if indicators is not None:
+            disconnection = indicators['disconnection']
+            bullshit_ratio = indicators['bullshit_ratio']
+            coherence_loss = indicators['coherence_loss']
+            historical_disconnect = indicators['historical_disconnect']
+        else:
+            current = self.crisis_indicators
+            disconnection = current.disconnection_level
+            bullshit_ratio = current.bullshit_ratio
+            coherence_loss = 1.0 - current.relevance_coherence
+            historical_disconnect = 1.0 - current.historical_continuity
         
-        if not crisis_detected:
-            return ["Relevance realization functioning normally"]
+        crisis_score = _crisis_score(disconnection, bullshit_ratio,
+                                     coherence_loss, historical_disconnect)
+        if crisis_score <= CRISIS_THRESHOLD:
+            return list(_NO_CRISIS_SUGGESTIONS)
             
-        if indicators['disconnection'] > 0.5:
-            suggestions.append("Enhance cross-modal integration to reduce disconnection")
-            suggestions.append("Strengthen self-other-world-future connection patterns")
+        suggestions = []
+        if disconnection > 0.5:
+            suggestions.extend(_DISCONNECTION_SUGGESTIONS)
             
-        if indicators['bullshit_ratio'] > 0.5:
-            suggestions.append("Activate truth-seeking (Aletheia) processes")
-            suggestions.append("Implement rigorous rational reflection protocols")
+        if bullshit_ratio > 0.5:
+            suggestions.extend(_BULLSHIT_SUGGESTIONS)
             
-        if indicators['coherence_loss'] > 0.5:
-            suggestions.append("Stabilize relevance judgment patterns")
-            suggestions.append("Engage in collaborative investigation processes")
+        if coherence_loss > 0.5:
+            suggestions.extend(_COHERENCE_SUGGESTIONS)
             
-        if indicators['historical_disconnect'] > 0.5:
-            suggestions.append("Integrate wisdom traditions and historical resources")
-            suggestions.append("Activate psychotechnology integration protocols")
+        if historical_disconnect > 0.5:
+            suggestions.extend(_HISTORICAL_SUGGESTIONS)
             
         return suggestions 
\ No newline at end of file
@@ -8,7 +8,8 @@ methods for advising, reflecting, and optimizing a wisdom ecology.
 """
 
 from dataclasses import dataclass
-from typing import Dict, Any, List, Tuple
+from itertools import chain
+from typing import Dict, Any, List, Optional, Tuple
 
 from .relevance_core import RelevanceCore
 from .meaning_making import MeaningMaker
@@ -30,6 +31,8 @@ from .phenomenology_core import PhenomenologicalMode
 
 @dataclass
 class SageReport:
+    __slots__ = ('refined_message', 'message_confidence', 'wisdom_metrics',
+                 'rationality_metrics', 'ecology_metrics', 'recommendations')
     refined_message: str
     message_confidence: float
     wisdom_metrics: Dict[str, float]
@@ -86,20 +89,23 @@ class SiliconSage:
             phenomenology_core=self.simple_phenomenology,
         )
 
+        # Recommendations are memoized per state version; every method that
+        # mutates the composed cores bumps the version.
+        self._state_version = 0
+        self._recs_cache: Optional[Tuple[int, List[str]]] = None
+
     def advise(self, message: str, context: Dict[str, Any]) -> SageReport:
         """
         Provide refined communication and a multi-core evaluation with recommendations.
         """
         refined_message, msg_conf = self.meaning_maker.communicate(message, context)
+        self._state_version += 1
 
         wisdom_metrics = self.wisdom_core.evaluate_wisdom()
         rationality_metrics = self.rationality_core.evaluate_rationality()
         ecology_metrics = self.wisdom_ecology.evaluate_ecology()
 
-        recs: List[str] = []
-        recs.extend(self.wisdom_core.optimize_wisdom())
-        recs.extend(self.rationality_core.optimize_rationality())
-        recs.extend(self.wisdom_ecology.get_optimization_recommendations())
+        recs = list(self._recommendations())
 
         return SageReport(
             refined_message=refined_message,
@@ -110,10 +116,46 @@ class SiliconSage:
             recommendations=recs,
         )
 
+    def advise_many(self, messages: List[str],
+                    contexts: List[Dict[str, Any]]) -> List[SageReport]:
+        """
+        Advise on a batch of messages, evaluating metrics and recommendations once.
+
+        Every message is communicated first; the metrics and recommendations
+        then reflect the state after the whole batch and are shared by all
+        returned reports, which should be treated as read-only.
+        """
+        if len(messages) != len(contexts):
+            raise ValueError("messages and contexts must have the same length")
+
+        refined = [
+            self.meaning_maker.communicate(message, context)
+            for message, context in zip(messages, contexts)
+        ]
+        self._state_version += 1
+
+        wisdom_metrics = self.wisdom_core.evaluate_wisdom()
+        rationality_metrics = self.rationality_core.evaluate_rationality()
+        ecology_metrics = self.wisdom_ecology.evaluate_ecology()
+        recs = list(self._recommendations())
+
+        return [
+            SageReport(
+                refined_message=refined_message,
+                message_confidence=msg_conf,
+                wisdom_metrics=wisdom_metrics,
+                rationality_metrics=rationality_metrics,
+                ecology_metrics=ecology_metrics,
+                recommendations=recs,
+            )
+            for refined_message, msg_conf in refined
+        ]
+
     def contemplate(self, experience: Dict[str, Any], context: Dict[str, Any]) -> None:
         """
         Update wisdom ecology and phenomenology based on a new experience.
         """
+        self._state_version += 1
         # Activate some ecology dimensions heuristically
         self.wisdom_ecology.activate_psychotechnology(
             tech_type=PsychotechnologyType.UNDERSTANDING,
@@ -134,16 +176,19 @@ class SiliconSage:
         """
         Return a deduplicated set of optimization recommendations across systems.
         """
-        recs: List[str] = []
-        recs.extend(self.wisdom_core.optimize_wisdom())
-        recs.extend(self.rationality_core.optimize_rationality())
-        recs.extend(self.wisdom_ecology.get_optimization_recommendations())
-        # Deduplicate preserving order
-        seen = set()
-        unique_recs: List[str] = []
-        for r in recs:
-            if r not in seen:
-                seen.add(r)
-                unique_recs.append(r)
-        return unique_recs
+        # Deduplicate preserving order in a single pass
+        return list(dict.fromkeys(self._recommendations()))
 
+    def _recommendations(self) -> List[str]:
+        """
+        Return recommendations from all systems, recomputed once per state version.
+        """
+        if self._recs_cache is not None and self._recs_cache[0] == self._state_version:
+            return self._recs_cache[1]
+        recs = list(chain(
+            self.wisdom_core.optimize_wisdom(),
+            self.rationality_core.optimize_rationality(),
+            self.wisdom_ecology.get_optimization_recommendations(),
+        ))
+        self._recs_cache = (self._state_version, recs)
+        return recs
@@ -5,32 +5,98 @@ Provides the main entry point and coordination for the cognitive service ecosyst
 """
 
 import asyncio
+import atexit
 import signal
 import logging
+import logging.handlers
 import argparse
+import copy
+import os
+import queue
 import sys
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Set
 import yaml
 import json
 
-from .service_manager import ServiceManager, ServiceConfig, ServiceType, ServiceStatus
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without LibYAML
+    from yaml import SafeLoader as YamlLoader
+
+try:
+    import uvloop
+except ImportError:  # optional, falls back to the stock asyncio loop
+    uvloop = None
+
+from .service_manager import (
+    ServiceManager, ServiceConfig, ServiceInstance, ServiceType, ServiceStatus
+)
 from .load_balancer import LoadBalancer, LoadBalancingStrategy
 from .health_monitor import HealthMonitor
 from .orchestrator import CognitiveOrchestrator
 
 logger = logging.getLogger(__name__)
 
+# Service types by config name, for O(1) lookup while registering
+_SERVICE_TYPES_BY_VALUE: Dict[str, ServiceType] = {
+    service_type.value: service_type for service_type in ServiceType
+}
+
+_YAML_SUFFIXES = frozenset({'.yaml', '.yml'})
+
+# Parsed config files keyed by (absolute path, mtime_ns, size)
+_CONFIG_CACHE: Dict[tuple, Dict] = {}
+
+@dataclass
+class DaemonSettings:
+    """Daemon settings read once from the loaded configuration."""
+    __slots__ = ('workers', 'load_balancing_strategy', 'metrics_interval')
+    workers: int
+    load_balancing_strategy: str
+    metrics_interval: int
+    
+    @classmethod
+    def from_config(cls, config: Dict) -> 'DaemonSettings':
+        """Build settings from a config dict, filling in defaults for missing keys."""
+        return cls(
+            workers=config.get('daemon', {}).get('workers', 4),
+            load_balancing_strategy=config.get('load_balancer', {}).get('strategy', 'round_robin'),
+            metrics_interval=config.get('monitoring', {}).get('metrics_interval', 60)
+        )
+
 class CognitiveDaemon:
     """Main daemon process for cognitive service orchestration."""
     
     def __init__(self, config_path: Optional[str] = None):
         self.config_path = config_path
         self.config: Dict = {}
+        self.settings = DaemonSettings.from_config(self.config)
         self.service_manager: Optional[ServiceManager] = None
         self.load_balancer: Optional[LoadBalancer] = None
         self.health_monitor: Optional[HealthMonitor] = None
         self.orchestrator: Optional[CognitiveOrchestrator] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._shutdown_event: Optional[asyncio.Event] = None
+        self._shutdown_task: Optional[asyncio.Task] = None
+        # Set by signal handlers; startup checks it between dependency levels
+        self._shutdown_requested = False
+        
+        # Running instances per type, kept current by status callbacks; the
+        # callbacks fire on service manager threads, so updates hold the lock
+        self._running_lock = threading.Lock()
+        self._running_counts: Dict[ServiceType, int] = {
+            service_type: 0 for service_type in ServiceType
+        }
+        self._running_instances: Set[str] = set()
+        # Reused across maintenance ticks by _log_system_status
+        self._status_summary: Dict[str, str] = {
+            service_type.value: "0/0" for service_type in ServiceType
+        }
         self.running = False
         
         # Set up logging
@@ -44,34 +110,64 @@ class CognitiveDaemon:
     
     def _setup_logging(self):
         """Configure logging for the daemon."""
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-            handlers=[
-                logging.StreamHandler(sys.stdout),
-                logging.FileHandler('cognitive_daemon.log')
-            ]
+        # Leave logging alone if it has already been configured
+        root_logger = logging.getLogger()
+        if root_logger.handlers:
+            return
+        
+        # Formatting and file I/O run on a listener thread; callers only enqueue
+        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+        stream_handler = logging.StreamHandler(sys.stdout)
+        file_handler = logging.handlers.RotatingFileHandler(
+            'cognitive_daemon.log', maxBytes=10 * 1024 * 1024, backupCount=5, delay=True
+        )
+        for handler in (stream_handler, file_handler):
+            handler.setFormatter(formatter)
+        
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        listener = logging.handlers.QueueListener(
+            log_queue, stream_handler, file_handler, respect_handler_level=True
         )
+        listener.start()
+        atexit.register(listener.stop)
+        
+        root_logger.setLevel(logging.INFO)
+        root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
     
     def load_config(self, config_path: str):
         """Load configuration from file."""
         try:
             config_file = Path(config_path)
-            if not config_file.exists():
-                raise FileNotFoundError(f"Config file not found: {config_path}")
+            suffix = config_file.suffix.lower()
+            if suffix not in _YAML_SUFFIXES and suffix != '.json':
+                raise ValueError(f"Unsupported config format: {config_file.suffix}")
+            try:
+                stat = config_file.stat()
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Config file not found: {config_path}") from None
             
-            with open(config_file, 'r') as f:
-                if config_file.suffix.lower() in ['.yaml', '.yml']:
-                    self.config = yaml.safe_load(f)
-                elif config_file.suffix.lower() == '.json':
-                    self.config = json.load(f)
-                else:
-                    raise ValueError(f"Unsupported config format: {config_file.suffix}")
+            # Reuse the parsed config while the file is unchanged
+            cache_key = (os.path.abspath(config_file), stat.st_mtime_ns, stat.st_size)
+            cached = _CONFIG_CACHE.get(cache_key)
+            if cached is not None:
+                self.config = copy.deepcopy(cached)
+                self.settings = DaemonSettings.from_config(self.config)
+                logger.info("Loaded configuration from %s (cached)", config_path)
+                return
+            
+            # Read the file in one call and parse from memory
+            data = config_file.read_bytes()
+            if suffix in _YAML_SUFFIXES:
+                self.config = yaml.load(data, Loader=YamlLoader)
+            else:
+                self.config = json.loads(data)
             
-            logger.info(f"Loaded configuration from {config_path}")
+            _CONFIG_CACHE[cache_key] = copy.deepcopy(self.config)
+            self.settings = DaemonSettings.from_config(self.config)
+            logger.info("Loaded configuration from %s", config_path)
             
         except Exception as e:
-            logger.error(f"Failed to load config: {e}")
+            logger.error("Failed to load config: %s", e)
             self._load_default_config()
     
     def _load_default_config(self):
@@ -139,6 +235,7 @@ class CognitiveDaemon:
                 'log_level': 'INFO'
             }
         }
+        self.settings = DaemonSettings.from_config(self.config)
         logger.info("Using default configuration")
     
     async def start(self):
@@ -149,6 +246,13 @@ class CognitiveDaemon:
         
         try:
             logger.info("Starting Cognitive Daemon")
+            self._shutdown_event = asyncio.Event()
+            self._shutdown_task = None
+            self._shutdown_requested = False
+            
+            # Run short-lived tasks eagerly until their first await (3.12+)
+            if hasattr(asyncio, 'eager_task_factory'):
+                asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
             
             # Initialize components
             await self._initialize_components()
@@ -160,13 +264,21 @@ class CognitiveDaemon:
             await self._start_services()
             
             self.running = True
+            if self._shutdown_requested:
+                # A signal arrived while starting; tear down what did start
+                await self.stop()
+                return
             logger.info("Cognitive Daemon started successfully")
             
             # Keep daemon running
             await self._main_loop()
             
+            # A signal-driven stop must finish before asyncio.run cancels it
+            if self._shutdown_task is not None:
+                await self._shutdown_task
+            
         except Exception as e:
-            logger.error(f"Failed to start daemon: {e}")
+            logger.error("Failed to start daemon: %s", e)
             await self.stop()
             raise
     
@@ -183,26 +295,45 @@ class CognitiveDaemon:
             if self.service_manager:
                 await self._stop_all_services()
             
-            # Stop components
+            # Stop components concurrently; each joins its monitor thread
+            component_stops = []
             if self.health_monitor:
-                self.health_monitor.stop()
+                component_stops.append(self._run_blocking(self.health_monitor.stop))
             
             if self.service_manager:
-                self.service_manager.stop_monitoring()
+                component_stops.append(self._run_blocking(self.service_manager.close))
+            await asyncio.gather(*component_stops)
+            
+            if self._executor:
+                self._executor.shutdown(wait=False)
+                self._executor = None
             
             logger.info("Cognitive Daemon stopped")
             
         except Exception as e:
-            logger.error(f"Error stopping daemon: {e}")
+            logger.error("Error stopping daemon: %s", e)
+        finally:
+            # Wake the main loop only once teardown is done
+            if self._shutdown_event:
+                self._shutdown_event.set()
     
     async def _initialize_components(self):
         """Initialize daemon components."""
+        # Thread pool for blocking service manager and monitor calls. It is
+        # bounded by daemon.workers so a burst of parallel service starts
+        # cannot grow the thread count, with or without the GIL.
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.settings.workers,
+            thread_name_prefix='cognitive-daemon'
+        )
+        
         # Initialize service manager
         self.service_manager = ServiceManager()
+        self.service_manager.add_status_callback(self._on_service_status_change)
         self.service_manager.start_monitoring()
         
         # Initialize load balancer
-        strategy = LoadBalancingStrategy(self.config['load_balancer']['strategy'])
+        strategy = LoadBalancingStrategy(self.settings.load_balancing_strategy)
         self.load_balancer = LoadBalancer(
             strategy=strategy,
             service_manager=self.service_manager
@@ -211,7 +342,7 @@ class CognitiveDaemon:
         # Initialize health monitor
         self.health_monitor = HealthMonitor(
             service_manager=self.service_manager,
-            check_interval=self.config['monitoring']['metrics_interval']
+            check_interval=self.settings.metrics_interval
         )
         self.health_monitor.start()
         
@@ -230,77 +361,163 @@ class CognitiveDaemon:
         
         for service_name, service_config in services_config.items():
             try:
-                service_type = ServiceType(service_name)
+                service_type = self._service_type(service_name)
+                dependencies = [self._service_type(dep)
+                                for dep in service_config.get('dependencies', [])]
                 instances = service_config.get('instances', 1)
                 port_start = service_config.get('port_start', 8000)
+                memory_limit = service_config.get('memory_limit', 512)
+                cpu_limit = service_config.get('cpu_limit', 0.5)
                 
                 # Create multiple instances if specified
                 for i in range(instances):
                     config = ServiceConfig(
                         service_type=service_type,
                         port=port_start + i,
-                        memory_limit=service_config.get('memory_limit', 512),
-                        cpu_limit=service_config.get('cpu_limit', 0.5),
-                        dependencies=[ServiceType(dep) for dep in service_config.get('dependencies', [])]
+                        memory_limit=memory_limit,
+                        cpu_limit=cpu_limit,
+                        dependencies=list(dependencies)
                     )
                     
                     instance_id = self.service_manager.register_service(config)
-                    logger.info(f"Registered {service_name} instance {i+1}: {instance_id}")
+                    logger.info("Registered %s instance %s: %s", service_name, i+1, instance_id)
                     
             except ValueError as e:
-                logger.error(f"Invalid service type '{service_name}': {e}")
+                logger.error("Invalid service type '%s': %s", service_name, e)
             except Exception as e:
-                logger.error(f"Failed to register service '{service_name}': {e}")
+                logger.error("Failed to register service '%s': %s", service_name, e)
+    
+    @staticmethod
+    def _service_type(name: str) -> ServiceType:
+        """Look up a service type by its config name."""
+        try:
+            return _SERVICE_TYPES_BY_VALUE[name]
+        except KeyError:
+            raise ValueError(f"'{name}' is not a valid ServiceType") from None
     
     async def _start_services(self):
         """Start all registered services in dependency order."""
-        # Determine startup order based on dependencies
-        startup_order = self._get_service_startup_order()
-        
-        for service_type in startup_order:
-            instances = self.service_manager.get_services_by_type(service_type)
+        # Services in the same dependency level do not depend on each other,
+        # so each level is started concurrently
+        services_by_type = self.service_manager.snapshot_by_type()
+        startup_order = self._get_service_startup_order(services_by_type)
+        for level_index, level in enumerate(startup_order):
+            if self._shutdown_requested:
+                logger.info("Shutdown requested, skipping remaining service startup")
+                return
+            
+            instances = [
+                instance
+                for service_type in level
+                for instance in services_by_type.get(service_type, [])
+            ]
+            if not instances:
+                continue
+            
+            results = await asyncio.gather(*(
+                self._run_blocking(self.service_manager.start_service, instance.config.instance_id)
+                for instance in instances
+            ))
             
-            for instance in instances:
-                success = self.service_manager.start_service(instance.config.instance_id)
+            started = []
+            for instance, success in zip(instances, results):
+                service_type = instance.config.service_type
                 if success:
-                    logger.info(f"Started {service_type.value} service: {instance.config.instance_id}")
+                    started.append(instance)
+                    logger.info("Started %s service: %s", service_type.value, instance.config.instance_id)
                 else:
-                    logger.error(f"Failed to start {service_type.value} service: {instance.config.instance_id}")
-                
-                # Brief delay between service starts
-                await asyncio.sleep(2)
+                    logger.error("Failed to start %s service: %s", service_type.value, instance.config.instance_id)
+            
+            # Dependents only start once this level reports healthy
+            if level_index < len(startup_order) - 1:
+                await self._wait_until_healthy(started)
+    
+    async def _wait_until_healthy(self, instances: List[ServiceInstance]):
+        """Wait until the given instances are healthy or their startup timeout expires."""
+        if not instances:
+            return
+        
+        timeout = max(instance.config.startup_timeout for instance in instances)
+        deadline = asyncio.get_running_loop().time() + timeout
+        while (not self._shutdown_requested and
+               any(instance.health_status != "healthy" for instance in instances)):
+            if asyncio.get_running_loop().time() >= deadline:
+                logger.warning("Timed out waiting for services to become healthy")
+                return
+            await asyncio.sleep(0.5)
     
     async def _stop_all_services(self):
         """Stop all running services."""
-        for instance_id in list(self.service_manager.services.keys()):
-            self.service_manager.stop_service(instance_id)
+        # Dependents stop before their dependencies; each level stops concurrently
+        services_by_type = self.service_manager.snapshot_by_type()
+        for level in reversed(self._get_service_startup_order(services_by_type)):
+            instance_ids = [
+                instance.config.instance_id
+                for service_type in level
+                for instance in services_by_type.get(service_type, [])
+                if instance.status in (ServiceStatus.RUNNING, ServiceStatus.STARTING)
+            ]
+            results = await asyncio.gather(*(
+                self._run_blocking(self.service_manager.stop_service, instance_id)
+                for instance_id in instance_ids
+            ), return_exceptions=True)
+            
+            for instance_id, result in zip(instance_ids, results):
+                if isinstance(result, Exception):
+                    logger.error("Error stopping service %s: %s", instance_id, result)
     
-    def _get_service_startup_order(self) -> List[ServiceType]:
-        """Determine the order to start services based on dependencies."""
-        # Simple topological sort for service dependencies
-        order = []
-        visited = set()
+    async def _run_blocking(self, func: Callable[..., Any], *args: Any) -> Any:
+        """Run a blocking call on the daemon's thread pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, func, *args)
+    
+    def _get_service_startup_order(
+        self,
+        services_by_type: Optional[Dict[ServiceType, List[ServiceInstance]]] = None
+    ) -> List[List[ServiceType]]:
+        """Group services into dependency levels, in the order they must start."""
+        if services_by_type is None:
+            services_by_type = self.service_manager.snapshot_by_type()
         
-        def visit(service_type: ServiceType):
-            if service_type in visited:
-                return
-            
-            visited.add(service_type)
-            
-            # Get an instance to check dependencies
-            instances = self.service_manager.get_services_by_type(service_type)
-            if instances:
-                for dep in instances[0].config.dependencies:
-                    visit(dep)
-            
-            order.append(service_type)
+        # Dependencies are read from one instance of each registered type
+        dependencies: Dict[ServiceType, List[ServiceType]] = {
+            service_type: instances[0].config.dependencies
+            for service_type, instances in services_by_type.items() if instances
+        }
+        referenced = set(dependencies).union(*dependencies.values())
+        nodes = [service_type for service_type in ServiceType if service_type in referenced]
         
-        # Visit all service types
-        for service_type in ServiceType:
-            if self.service_manager.get_services_by_type(service_type):
-                visit(service_type)
+        # Kahn's algorithm: each service sits one level above its deepest dependency
+        in_degree = {service_type: 0 for service_type in nodes}
+        dependents: Dict[ServiceType, List[ServiceType]] = {service_type: [] for service_type in nodes}
+        for service_type, deps in dependencies.items():
+            for dep in set(deps):
+                in_degree[service_type] += 1
+                dependents[dep].append(service_type)
         
-        return order
+        levels = {service_type: 0 for service_type in nodes}
+        ready = deque(service_type for service_type in nodes if in_degree[service_type] == 0)
+        while ready:
+            service_type = ready.popleft()
+            for dependent in dependents[service_type]:
+                levels[dependent] = max(levels[dependent], levels[service_type] + 1)
+                in_degree[dependent] -= 1
+                if in_degree[dependent] == 0:
+                    ready.append(dependent)
+        
+        order: List[List[ServiceType]] = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        cyclic = []
+        for service_type in nodes:
+            if in_degree[service_type]:
+                cyclic.append(service_type)
+            else:
+                order[levels[service_type]].append(service_type)
+        
+        # Services in or behind a dependency cycle are still started, last
+        if cyclic:
+            logger.warning("Dependency cycle blocks ordering of services: %s", [st.value for st in cyclic])
+            order.append(cyclic)
+        return [level for level in order if level]
     
     async def _main_loop(self):
         """Main daemon loop."""
@@ -309,51 +526,87 @@ class CognitiveDaemon:
                 # Perform periodic maintenance
                 await self._perform_maintenance()
                 
-                # Wait before next cycle
-                await asyncio.sleep(30)
+                # Wait before next cycle, waking early on shutdown
+                await self._wait_for_shutdown(30)
                 
             except Exception as e:
-                logger.error(f"Error in main loop: {e}")
-                await asyncio.sleep(5)
+                logger.error("Error in main loop: %s", e)
+                await self._wait_for_shutdown(5)
+    
+    async def _wait_for_shutdown(self, timeout: float):
+        """Sleep for up to timeout seconds, returning as soon as shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._shutdown_event.wait(), timeout=timeout)
+        except asyncio.TimeoutError:
+            pass
     
     async def _perform_maintenance(self):
         """Perform periodic maintenance tasks."""
         # Check system health
         if self.health_monitor:
-            health_status = self.health_monitor.get_system_health()
+            health_status = await self._run_blocking(self.health_monitor.get_system_health)
             if health_status['status'] != 'healthy':
-                logger.warning(f"System health check failed: {health_status}")
+                logger.warning("System health check failed: %s", health_status)
         
         # Update load balancer
         if self.load_balancer:
-            self.load_balancer.update_service_weights()
+            await self._run_blocking(self.load_balancer.update_service_weights)
         
         # Log system status
         self._log_system_status()
     
     def _log_system_status(self):
         """Log current system status."""
-        if not self.service_manager:
+        if not self.service_manager or not logger.isEnabledFor(logging.INFO):
             return
         
-        status_summary = {}
+        registry = self.service_manager.service_registry
+        status_summary = self._status_summary
+        with self._running_lock:
+            running_counts = dict(self._running_counts)
         for service_type in ServiceType:
-            instances = self.service_manager.get_services_by_type(service_type)
-            running_count = sum(1 for instance in instances 
-                              if instance.status == ServiceStatus.RUNNING)
-            total_count = len(instances)
-            status_summary[service_type.value] = f"{running_count}/{total_count}"
+            running_count = running_counts[service_type]
+            total_count = len(registry.get(service_type, []))
+            status_summary[service_type.value] = "%d/%d" % (running_count, total_count)
         
-        logger.info(f"Service status: {status_summary}")
+        logger.info("Service status: %s", status_summary)
+    
+    def _on_service_status_change(self, instance_id: str, status: ServiceStatus):
+        """Keep per-type running counts in step with service status changes."""
+        instance = self.service_manager.services.get(instance_id)
+        if instance is None:
+            return
+        
+        service_type = instance.config.service_type
+        with self._running_lock:
+            if status == ServiceStatus.RUNNING:
+                if instance_id not in self._running_instances:
+                    self._running_instances.add(instance_id)
+                    self._running_counts[service_type] += 1
+            elif instance_id in self._running_instances:
+                self._running_instances.remove(instance_id)
+                self._running_counts[service_type] -= 1
     
     def _setup_signal_handlers(self):
         """Set up signal handlers for graceful shutdown."""
-        def signal_handler(signum, frame):
-            logger.info(f"Received signal {signum}, initiating shutdown")
-            asyncio.create_task(self.stop())
+        loop = asyncio.get_running_loop()
         
-        signal.signal(signal.SIGINT, signal_handler)
-        signal.signal(signal.SIGTERM, signal_handler)
+        def signal_handler(signum: int):
+            logger.info("Received signal %s, initiating shutdown", signum)
+            self._shutdown_requested = True
+            if not self.running:
+                return  # Still starting; start() stops once startup unwinds
+            
+            # A finished stop that found nothing to do must not swallow later signals
+            if self._shutdown_task is None or self._shutdown_task.done():
+                self._shutdown_task = loop.create_task(self.stop())
+        
+        for signum in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(signum, signal_handler, signum)
+            except NotImplementedError:
+                # Event loops without signal support (e.g. on Windows)
+                signal.signal(signum, lambda sig, frame: loop.call_soon_threadsafe(signal_handler, sig))
 
 def main():
     """Main entry point for the cognitive daemon."""
@@ -367,6 +620,10 @@ def main():
     # Set logging level
     logging.getLogger().setLevel(getattr(logging, args.log_level))
     
+    # Prefer the libuv-based event loop when it is installed
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    
     # Create and start daemon
     daemon = CognitiveDaemon(config_path=args.config)
     
@@ -375,7 +632,7 @@ def main():
     except KeyboardInterrupt:
         logger.info("Received interrupt, shutting down")
     except Exception as e:
-        logger.error(f"Daemon failed: {e}")
+        logger.error("Daemon failed: %s", e)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -4,18 +4,69 @@ Health Monitor for VM-Daemon-Sys
 Monitors the health and performance of cognitive services.
 """
 
+import queue
+import sys
 import threading
 import time
 import logging
+from collections import Counter
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor, wait
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Sequence as SequenceType, Set, Tuple
 from datetime import datetime, timedelta
 from enum import Enum
+from itertools import chain
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # optional, falls back to the NumPy threshold compare
+    njit = None
 
 from .service_manager import ServiceManager, ServiceType, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+# Slotted dataclasses need Python 3.10+; older interpreters keep a __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Simulated metric columns with their (low, high) sampling ranges and collection
+# period in check ticks; slower-moving metrics reuse their last value in between
+_SIMULATED_METRICS = (
+    ('cpu_usage', 10.0, 95.0, 1),
+    ('memory_usage', 20.0, 90.0, 1),
+    ('avg_response_time', 50.0, 2000.0, 1),
+    ('error_rate', 0.0, 0.15, 1),
+    ('cognitive_load', 0.1, 1.0, 5),
+    ('connections', 0.0, 151.0, 5),
+)
+_SIMULATED_KEYS = tuple(key for key, _, _, _ in _SIMULATED_METRICS)
+_SIMULATED_LOW = np.array([low for _, low, _, _ in _SIMULATED_METRICS])
+_SIMULATED_SPAN = np.array([high - low for _, low, high, _ in _SIMULATED_METRICS])
+_SIMULATED_PERIODS = np.array([period for _, _, _, period in _SIMULATED_METRICS])
+_CONNECTIONS_COLUMN = _SIMULATED_KEYS.index('connections')
+
+# Pending alerts beyond this are dropped rather than queued
+_ALERT_QUEUE_SIZE = 1024
+
+# Alert callbacks run concurrently on this many worker threads
+_ALERT_WORKERS = 4
+# Smoothing factor for the per-callback latency average used to order dispatch
+_CALLBACK_LATENCY_ALPHA = 0.2
+
+# Recommendations when a service metric is critical, shared across reports
+_RECOMMENDATIONS = {
+    'cpu_usage': "Consider scaling up or optimizing CPU-intensive operations",
+    'memory_usage': "Consider increasing memory allocation or optimizing memory usage",
+    'response_time': "Investigate performance bottlenecks or scale horizontally",
+    'error_rate': "Investigate error causes and implement fixes",
+    'cognitive_load': "Reduce cognitive complexity or add more processing capacity",
+}
+_REC_CRITICAL_SERVICES = "Immediately investigate critical services"
+_REC_WARNING_SERVICES = "Monitor warning services closely"
+
 class HealthStatus(Enum):
     """Health status levels."""
     HEALTHY = "healthy"
@@ -23,7 +74,38 @@ class HealthStatus(Enum):
     CRITICAL = "critical"
     UNKNOWN = "unknown"
 
-@dataclass
+# Integer severities for status comparisons; _evaluate_batch returns the first three
+_SEVERITY_HEALTHY, _SEVERITY_WARNING, _SEVERITY_CRITICAL, _SEVERITY_UNKNOWN = range(4)
+_STATUS_BY_CODE = (HealthStatus.HEALTHY, HealthStatus.WARNING, HealthStatus.CRITICAL, HealthStatus.UNKNOWN)
+_SEVERITY = {status: code for code, status in enumerate(_STATUS_BY_CODE)}
+
+def _evaluate_batch(values: np.ndarray, warn: np.ndarray, crit: np.ndarray) -> np.ndarray:
+    """Classify metric values against thresholds as 0 (healthy), 1 (warning) or 2 (critical)."""
+    return np.where(values >= crit, 2, np.where(values >= warn, 1, 0)).astype(np.int8)
+
+def _evaluate_service(values: np.ndarray, warn: np.ndarray, crit: np.ndarray) -> Tuple[int, np.ndarray]:
+    """Return the worst status code of a service and the per-metric codes."""
+    codes = _evaluate_batch(values, warn, crit)
+    return int(codes.max()) if codes.size else 0, codes
+
+if njit is not None:
+    @njit(cache=True)
+    def _evaluate_service(values, warn, crit):
+        codes = np.empty(values.size, np.int8)
+        worst = 0
+        for i in range(values.size):
+            if values[i] >= crit[i]:
+                code = 2
+            elif values[i] >= warn[i]:
+                code = 1
+            else:
+                code = 0
+            codes[i] = code
+            if code > worst:
+                worst = code
+        return worst, codes
+
+@dataclass(**_DATACLASS_SLOTS)
 class HealthMetric:
     """Individual health metric."""
     name: str
@@ -33,30 +115,114 @@ class HealthMetric:
     unit: str = ""
     description: str = ""
 
-@dataclass
+class MetricSeries(Sequence):
+    """Per-service metric values stored as arrays, read as HealthMetric objects.
+    
+    Service reports keep one value array plus the threshold arrays in effect
+    for the check; HealthMetric objects are only built when indexed.
+    """
+    __slots__ = ('specs', 'values', 'warning', 'critical')
+    
+    def __init__(self, specs: Tuple[tuple, ...], values: np.ndarray,
+                 warning: np.ndarray, critical: np.ndarray):
+        self.specs = specs
+        self.values = values
+        self.warning = warning
+        self.critical = critical
+    
+    @classmethod
+    def concat(cls, series: List['MetricSeries']) -> 'MetricSeries':
+        """Join several series into one without materializing their metrics."""
+        if not series:
+            empty = np.empty(0)
+            return cls((), empty, empty, empty)
+        return cls(
+            tuple(chain.from_iterable(item.specs for item in series)),
+            np.concatenate([item.values for item in series]),
+            np.concatenate([item.warning for item in series]),
+            np.concatenate([item.critical for item in series])
+        )
+    
+    def __len__(self) -> int:
+        return len(self.specs)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        name, _, unit, description = self.specs[index][:4]
+        return HealthMetric(
+            name=name,
+            value=float(self.values[index]),
+            threshold_warning=float(self.warning[index]),
+            threshold_critical=float(self.critical[index]),
+            unit=unit,
+            description=description
+        )
+    
+    def __eq__(self, other):
+        # Compare like the list of HealthMetric objects reports used to hold
+        if isinstance(other, (MetricSeries, list, tuple)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    __hash__ = None
+    
+    def __repr__(self) -> str:
+        return f"MetricSeries({list(self)!r})"
+
+@dataclass(**_DATACLASS_SLOTS)
 class HealthReport:
-    """Health report for a service or system."""
+    """Health report for a service or system.
+    
+    ``metrics`` is a read-only sequence of HealthMetric. Reports built by the
+    monitor hold a MetricSeries, so use ``list(report.metrics)`` for a
+    mutable copy.
+    """
     status: HealthStatus
-    metrics: List[HealthMetric] = field(default_factory=list)
+    metrics: SequenceType[HealthMetric] = field(default_factory=list)
     issues: List[str] = field(default_factory=list)
     recommendations: List[str] = field(default_factory=list)
     timestamp: datetime = field(default_factory=datetime.now)
+    # Integer form of status, so hot paths compare ints instead of enum members
+    severity: int = field(init=False, repr=False, compare=False)
+    
+    def __post_init__(self):
+        self.severity = _SEVERITY[self.status]
 
 class HealthMonitor:
     """Monitors health and performance of cognitive services."""
     
+    # Per-service checks: (name, metrics key, unit, description, issue label, value format)
+    _METRIC_SPECS = (
+        ("cpu_usage", "cpu_usage", "%", "CPU utilization", "CPU usage", "{:.1f}%"),
+        ("memory_usage", "memory_usage", "%", "Memory utilization", "memory usage", "{:.1f}%"),
+        ("response_time", "avg_response_time", "ms", "Average response time", "response time", "{:.1f}ms"),
+        ("error_rate", "error_rate", "%", "Error rate", "error rate", "{:.2%}"),
+        ("cognitive_load", "cognitive_load", "", "Cognitive processing load", "cognitive load", "{:.2f}"),
+    )
+    
     def __init__(self, service_manager: ServiceManager, check_interval: int = 60):
         self.service_manager = service_manager
         self.check_interval = check_interval
         self.running = False
         self.monitor_thread: Optional[threading.Thread] = None
+        self._stop_event = threading.Event()
         
         # Health reports cache
         self.service_reports: Dict[str, HealthReport] = {}
         self.system_report: Optional[HealthReport] = None
+        # Services whose report was added or changed status since the last aggregation
+        self._dirty_services: Set[str] = set()
+        # Number of stored service reports in each status, kept in step with service_reports
+        self._status_counts: Counter = Counter()
         
         # Alert callbacks
         self.alert_callbacks: List[Callable[[str, HealthStatus, HealthReport], None]] = []
+        self._alert_queue: Optional[queue.Queue] = None
+        self._alert_thread: Optional[threading.Thread] = None
+        self._alert_pool: Optional[ThreadPoolExecutor] = None
+        # Smoothed seconds per callback; slower callbacks are submitted first
+        self._callback_latency: Dict[Callable, float] = {}
         
         # Thresholds
         self.thresholds = {
@@ -68,7 +234,16 @@ class HealthMonitor:
             'cognitive_load': {'warning': 0.8, 'critical': 0.95}
         }
         
+        self._metric_thresholds: Dict[str, tuple] = {}
+        self._resolve_thresholds()
+        
         self.lock = threading.RLock()
+        
+        # Generator for simulated metrics, sampled for all services at once
+        self._rng = np.random.default_rng()
+        # Check tick counter and last sampled row per service for per-metric periods
+        self._tick = 0
+        self._last_samples: Dict[str, np.ndarray] = {}
     
     def start(self):
         """Start health monitoring."""
@@ -76,6 +251,12 @@ class HealthMonitor:
             return
         
         self.running = True
+        self._stop_event.clear()
+        self._alert_queue = queue.Queue(maxsize=_ALERT_QUEUE_SIZE)
+        self._alert_pool = ThreadPoolExecutor(max_workers=_ALERT_WORKERS,
+                                              thread_name_prefix="health-alert")
+        self._alert_thread = threading.Thread(target=self._alert_loop, daemon=True)
+        self._alert_thread.start()
         self.monitor_thread = threading.Thread(target=self._monitor_loop, daemon=True)
         self.monitor_thread.start()
         logger.info("Health monitoring started")
@@ -83,21 +264,32 @@ class HealthMonitor:
     def stop(self):
         """Stop health monitoring."""
         self.running = False
+        self._stop_event.set()
         if self.monitor_thread:
             self.monitor_thread.join(timeout=5)
+        if self._alert_thread:
+            try:
+                self._alert_queue.put(None, timeout=5)
+            except queue.Full:
+                logger.warning("Alert queue full; dispatcher stopping without draining")
+            self._alert_thread.join(timeout=5)
+            self._alert_thread = None
+            self._alert_queue = None
+        if self._alert_pool:
+            self._alert_pool.shutdown(wait=True)
+            self._alert_pool = None
         logger.info("Health monitoring stopped")
     
     def get_service_health(self, instance_id: str) -> Optional[HealthReport]:
         """Get health report for a specific service instance."""
-        with self.lock:
-            return self.service_reports.get(instance_id)
+        return self.service_reports.get(instance_id)
     
     def get_system_health(self) -> HealthReport:
         """Get overall system health report."""
-        with self.lock:
-            if self.system_report is None:
-                return HealthReport(status=HealthStatus.UNKNOWN)
-            return self.system_report
+        report = self.system_report
+        if report is None:
+            return HealthReport(status=HealthStatus.UNKNOWN)
+        return report
     
     def get_service_type_health(self, service_type: ServiceType) -> HealthReport:
         """Get aggregated health for all instances of a service type."""
@@ -110,23 +302,36 @@ class HealthMonitor:
             )
         
         # Aggregate health across instances
-        all_metrics = []
-        all_issues = []
-        worst_status = HealthStatus.HEALTHY
-        
+        service_reports = self.service_reports
+        reported = []
         for instance in instances:
             instance_id = instance.config.instance_id
-            report = self.get_service_health(instance_id)
-            
+            report = service_reports.get(instance_id)
             if report:
-                all_metrics.extend(report.metrics)
-                all_issues.extend([f"{instance_id}: {issue}" for issue in report.issues])
-                
-                # Track worst status
-                if report.status == HealthStatus.CRITICAL:
-                    worst_status = HealthStatus.CRITICAL
-                elif report.status == HealthStatus.WARNING and worst_status != HealthStatus.CRITICAL:
-                    worst_status = HealthStatus.WARNING
+                reported.append((instance_id, report))
+        
+        # Array-backed metrics are joined lazily; anything else is copied into a list
+        series = [report.metrics for _, report in reported if len(report.metrics)]
+        if all(isinstance(metrics, MetricSeries) for metrics in series):
+            all_metrics = MetricSeries.concat(series)
+        else:
+            all_metrics = [None] * sum(len(metrics) for metrics in series)
+            base = 0
+            for metrics in series:
+                all_metrics[base:base + len(metrics)] = metrics
+                base += len(metrics)
+        
+        # Track worst status; unknown reports don't count towards it
+        worst = _SEVERITY_HEALTHY
+        for _, report in reported:
+            if worst < report.severity < _SEVERITY_UNKNOWN:
+                worst = report.severity
+        worst_status = _STATUS_BY_CODE[worst]
+        
+        all_issues = list(chain.from_iterable(
+            (f"{instance_id}: {issue}" for issue in report.issues)
+            for instance_id, report in reported
+        ))
         
         return HealthReport(
             status=worst_status,
@@ -144,38 +349,93 @@ class HealthMonitor:
             'warning': warning,
             'critical': critical
         }
+        self._resolve_thresholds()
+    
+    def _resolve_thresholds(self):
+        """Flatten thresholds into (warning, critical) pairs for the check loop."""
+        self._metric_thresholds = {
+            name: (levels['warning'], levels['critical'])
+            for name, levels in self.thresholds.items()
+        }
+        self._warn_vec = np.array([self._metric_thresholds[spec[0]][0] for spec in self._METRIC_SPECS],
+                                  dtype=float)
+        self._crit_vec = np.array([self._metric_thresholds[spec[0]][1] for spec in self._METRIC_SPECS],
+                                  dtype=float)
     
     def _monitor_loop(self):
         """Main monitoring loop."""
+        # Checks run on fixed monotonic deadlines so long passes don't shift the schedule
+        deadline = time.monotonic()
         while self.running:
             try:
                 self._perform_health_checks()
-                time.sleep(self.check_interval)
+                # A pass that overran its slot skips the missed ticks instead of bursting
+                deadline = max(deadline + self.check_interval, time.monotonic())
             except Exception as e:
                 logger.error(f"Error in health monitoring loop: {e}")
-                time.sleep(5)
+                deadline = time.monotonic() + 5
+            if self._stop_event.wait(max(0.0, deadline - time.monotonic())):
+                break
     
     def _perform_health_checks(self):
         """Perform health checks on all services."""
         with self.lock:
-            # Check individual services
-            for instance_id, instance in self.service_manager.services.items():
-                if instance.status == ServiceStatus.RUNNING:
-                    report = self._check_service_health(instance_id, instance)
-                    
-                    # Store report
-                    old_status = self.service_reports.get(instance_id, HealthReport(HealthStatus.UNKNOWN)).status
-                    self.service_reports[instance_id] = report
-                    
-                    # Send alerts if status changed to warning or critical
-                    if (report.status in [HealthStatus.WARNING, HealthStatus.CRITICAL] and 
-                        old_status != report.status):
-                        self._send_alerts(instance_id, report.status, report)
+            services = dict(self.service_manager.services)
+            old_reports = self.service_reports
+        running = [(instance_id, instance) for instance_id, instance in services.items()
+                   if instance.status == ServiceStatus.RUNNING]
+        
+        # Build the next report set without holding the lock, stamped with one tick time
+        now = datetime.now()
+        batch = self._get_service_metrics_batch([instance_id for instance_id, _ in running])
+        dirty = []
+        transitions = Counter()
+        
+        # Drop reports of services that are no longer registered
+        new_reports = {}
+        for instance_id, report in old_reports.items():
+            if instance_id in services:
+                new_reports[instance_id] = report
+            else:
+                dirty.append(instance_id)
+                transitions[report.status] -= 1
+        alerts = []
+        
+        # Check individual services
+        for instance_id, instance in running:
+            report = self._check_service_health(instance_id, instance, batch[instance_id], now)
+            
+            # Store report
+            old_report = old_reports.get(instance_id)
+            old_severity = old_report.severity if old_report else _SEVERITY_UNKNOWN
+            new_reports[instance_id] = report
+            if old_report is None or old_severity != report.severity:
+                dirty.append(instance_id)
+                if old_report is not None:
+                    transitions[old_report.status] -= 1
+                transitions[report.status] += 1
+            
+            # Send alerts if status changed to warning or critical
+            if (_SEVERITY_WARNING <= report.severity <= _SEVERITY_CRITICAL and 
+                old_severity != report.severity):
+                alerts.append((instance_id, report.status, report))
+        
+        with self.lock:
+            self.service_reports = new_reports
+            self._dirty_services.update(dirty)
+            self._status_counts.update(transitions)
             
-            # Update system health
-            self._update_system_health()
+            # Update system health only when a service's status changed
+            if self._dirty_services or self.system_report is None:
+                self._update_system_health(now)
+                self._dirty_services.clear()
+        
+        for instance_id, status, report in alerts:
+            self._queue_alert(instance_id, status, report)
     
-    def _check_service_health(self, instance_id: str, instance) -> HealthReport:
+    def _check_service_health(self, instance_id: str, instance,
+                              service_metrics: Optional[Dict] = None,
+                              timestamp: Optional[datetime] = None) -> HealthReport:
         """Check health of a specific service instance."""
         metrics = []
         issues = []
@@ -184,107 +444,27 @@ class HealthMonitor:
         
         try:
             # Simulate getting metrics (in real implementation, this would query the service)
-            service_metrics = self._get_service_metrics(instance_id)
-            
-            # Check CPU usage
-            cpu_metric = HealthMetric(
-                name="cpu_usage",
-                value=service_metrics.get('cpu_usage', 0),
-                threshold_warning=self.thresholds['cpu_usage']['warning'],
-                threshold_critical=self.thresholds['cpu_usage']['critical'],
-                unit="%",
-                description="CPU utilization"
-            )
-            metrics.append(cpu_metric)
-            
-            status = self._evaluate_metric_status(cpu_metric)
-            if status == HealthStatus.CRITICAL:
-                overall_status = HealthStatus.CRITICAL
-                issues.append(f"High CPU usage: {cpu_metric.value:.1f}%")
-                recommendations.append("Consider scaling up or optimizing CPU-intensive operations")
-            elif status == HealthStatus.WARNING and overall_status != HealthStatus.CRITICAL:
-                overall_status = HealthStatus.WARNING
-                issues.append(f"Elevated CPU usage: {cpu_metric.value:.1f}%")
-            
-            # Check memory usage
-            memory_metric = HealthMetric(
-                name="memory_usage",
-                value=service_metrics.get('memory_usage', 0),
-                threshold_warning=self.thresholds['memory_usage']['warning'],
-                threshold_critical=self.thresholds['memory_usage']['critical'],
-                unit="%",
-                description="Memory utilization"
-            )
-            metrics.append(memory_metric)
-            
-            status = self._evaluate_metric_status(memory_metric)
-            if status == HealthStatus.CRITICAL:
-                overall_status = HealthStatus.CRITICAL
-                issues.append(f"High memory usage: {memory_metric.value:.1f}%")
-                recommendations.append("Consider increasing memory allocation or optimizing memory usage")
-            elif status == HealthStatus.WARNING and overall_status != HealthStatus.CRITICAL:
-                overall_status = HealthStatus.WARNING
-                issues.append(f"Elevated memory usage: {memory_metric.value:.1f}%")
-            
-            # Check response time
-            response_time_metric = HealthMetric(
-                name="response_time",
-                value=service_metrics.get('avg_response_time', 0),
-                threshold_warning=self.thresholds['response_time']['warning'],
-                threshold_critical=self.thresholds['response_time']['critical'],
-                unit="ms",
-                description="Average response time"
-            )
-            metrics.append(response_time_metric)
-            
-            status = self._evaluate_metric_status(response_time_metric)
-            if status == HealthStatus.CRITICAL:
-                overall_status = HealthStatus.CRITICAL
-                issues.append(f"High response time: {response_time_metric.value:.1f}ms")
-                recommendations.append("Investigate performance bottlenecks or scale horizontally")
-            elif status == HealthStatus.WARNING and overall_status != HealthStatus.CRITICAL:
-                overall_status = HealthStatus.WARNING
-                issues.append(f"Elevated response time: {response_time_metric.value:.1f}ms")
-            
-            # Check error rate
-            error_rate_metric = HealthMetric(
-                name="error_rate",
-                value=service_metrics.get('error_rate', 0),
-                threshold_warning=self.thresholds['error_rate']['warning'],
-                threshold_critical=self.thresholds['error_rate']['critical'],
-                unit="%",
-                description="Error rate"
-            )
-            metrics.append(error_rate_metric)
+            if service_metrics is None:
+                service_metrics = self._get_service_metrics(instance_id)
             
-            status = self._evaluate_metric_status(error_rate_metric)
-            if status == HealthStatus.CRITICAL:
-                overall_status = HealthStatus.CRITICAL
-                issues.append(f"High error rate: {error_rate_metric.value:.2%}")
-                recommendations.append("Investigate error causes and implement fixes")
-            elif status == HealthStatus.WARNING and overall_status != HealthStatus.CRITICAL:
-                overall_status = HealthStatus.WARNING
-                issues.append(f"Elevated error rate: {error_rate_metric.value:.2%}")
+            values = np.array([service_metrics.get(spec[1], 0) for spec in self._METRIC_SPECS],
+                              dtype=float)
+            metrics = MetricSeries(self._METRIC_SPECS, values, self._warn_vec, self._crit_vec)
             
-            # Check cognitive load (custom metric)
-            cognitive_load_metric = HealthMetric(
-                name="cognitive_load",
-                value=service_metrics.get('cognitive_load', 0),
-                threshold_warning=self.thresholds['cognitive_load']['warning'],
-                threshold_critical=self.thresholds['cognitive_load']['critical'],
-                unit="",
-                description="Cognitive processing load"
-            )
-            metrics.append(cognitive_load_metric)
+            worst, codes = _evaluate_service(values, self._warn_vec, self._crit_vec)
+            overall_status = _STATUS_BY_CODE[worst]
             
-            status = self._evaluate_metric_status(cognitive_load_metric)
-            if status == HealthStatus.CRITICAL:
-                overall_status = HealthStatus.CRITICAL
-                issues.append(f"High cognitive load: {cognitive_load_metric.value:.2f}")
-                recommendations.append("Reduce cognitive complexity or add more processing capacity")
-            elif status == HealthStatus.WARNING and overall_status != HealthStatus.CRITICAL:
-                overall_status = HealthStatus.WARNING
-                issues.append(f"Elevated cognitive load: {cognitive_load_metric.value:.2f}")
+            # Warnings listed after the first critical metric are not reported
+            seen_critical = False
+            for index in np.flatnonzero(codes).tolist():
+                name, _, _, _, label, value_format = self._METRIC_SPECS[index]
+                value = float(values[index])
+                if codes[index] == 2:
+                    seen_critical = True
+                    issues.append(f"High {label}: {value_format.format(value)}")
+                    recommendations.append(_RECOMMENDATIONS[name])
+                elif not seen_critical:
+                    issues.append(f"Elevated {label}: {value_format.format(value)}")
             
         except Exception as e:
             logger.error(f"Error checking health for {instance_id}: {e}")
@@ -295,23 +475,63 @@ class HealthMonitor:
             status=overall_status,
             metrics=metrics,
             issues=issues,
-            recommendations=recommendations
+            recommendations=recommendations,
+            timestamp=timestamp or datetime.now()
         )
     
     def _get_service_metrics(self, instance_id: str) -> Dict:
         """Get metrics for a service instance."""
         # In a real implementation, this would query the actual service
         # For simulation, return some sample metrics
-        import random
+        return dict(zip(_SIMULATED_KEYS, self._sample_metrics(1)[0].tolist()))
+    
+    def _get_service_metrics_batch(self, instance_ids: List[str]) -> Dict[str, Dict]:
+        """Get metrics for several service instances with one service manager call."""
+        reported = self.service_manager.get_metrics_batch(instance_ids)
+        samples = self._collect_samples(instance_ids).tolist()
+        batch = {}
+        for instance_id, row in zip(instance_ids, samples):
+            # Simulated values fill in whatever the service has not reported
+            metrics = dict(zip(_SIMULATED_KEYS, row))
+            metrics.update(reported.get(instance_id, {}))
+            batch[instance_id] = metrics
+        return batch
+    
+    def _collect_samples(self, instance_ids: List[str]) -> np.ndarray:
+        """Sample the metric columns due this tick, reusing cached values for the rest."""
+        due = self._tick % _SIMULATED_PERIODS == 0
+        self._tick += 1
+        cached = self._last_samples
+        known = np.fromiter((instance_id in cached for instance_id in instance_ids),
+                            dtype=bool, count=len(instance_ids))
         
-        return {
-            'cpu_usage': random.uniform(10, 95),
-            'memory_usage': random.uniform(20, 90),
-            'avg_response_time': random.uniform(50, 2000),
-            'error_rate': random.uniform(0, 0.15),
-            'cognitive_load': random.uniform(0.1, 1.0),
-            'connections': random.randint(0, 150)
-        }
+        samples = np.empty((len(instance_ids), len(_SIMULATED_METRICS)))
+        if known.any():
+            samples[known] = [cached[instance_id]
+                              for instance_id, seen in zip(instance_ids, known) if seen]
+            if due.any():
+                samples[np.ix_(known, due)] = self._sample_metrics(int(known.sum()), due)
+        # Services without a cached row get every column sampled
+        fresh = ~known
+        if fresh.any():
+            samples[fresh] = self._sample_metrics(int(fresh.sum()))
+        
+        # Only the services sampled this tick stay cached
+        self._last_samples = dict(zip(instance_ids, samples))
+        return samples
+    
+    def _sample_metrics(self, count: int, columns: Optional[np.ndarray] = None) -> np.ndarray:
+        """Draw simulated metrics for count services in one call, one row per service.
+        
+        columns optionally masks which metric columns to draw.
+        """
+        if columns is None:
+            columns = np.ones(len(_SIMULATED_METRICS), dtype=bool)
+        samples = self._rng.random((count, int(columns.sum()))) * _SIMULATED_SPAN[columns] + _SIMULATED_LOW[columns]
+        if columns[_CONNECTIONS_COLUMN]:
+            connections = int(columns[:_CONNECTIONS_COLUMN].sum())
+            samples[:, connections] = np.floor(samples[:, connections])
+        return samples
     
     def _evaluate_metric_status(self, metric: HealthMetric) -> HealthStatus:
         """Evaluate the status of a metric based on thresholds."""
@@ -322,19 +542,17 @@ class HealthMonitor:
         else:
             return HealthStatus.HEALTHY
     
-    def _update_system_health(self):
+    def _update_system_health(self, timestamp: Optional[datetime] = None):
         """Update overall system health based on service health."""
+        timestamp = timestamp or datetime.now()
         if not self.service_reports:
-            self.system_report = HealthReport(status=HealthStatus.UNKNOWN)
+            self.system_report = HealthReport(status=HealthStatus.UNKNOWN, timestamp=timestamp)
             return
         
         # Count services by status
-        status_counts = {status: 0 for status in HealthStatus}
+        status_counts = self._status_counts
         total_services = len(self.service_reports)
         
-        for report in self.service_reports.values():
-            status_counts[report.status] += 1
-        
         # Determine overall status
         if status_counts[HealthStatus.CRITICAL] > 0:
             overall_status = HealthStatus.CRITICAL
@@ -379,23 +597,64 @@ class HealthMonitor:
         
         if status_counts[HealthStatus.CRITICAL] > 0:
             issues.append(f"{status_counts[HealthStatus.CRITICAL]} services in critical state")
-            recommendations.append("Immediately investigate critical services")
+            recommendations.append(_REC_CRITICAL_SERVICES)
         
         if status_counts[HealthStatus.WARNING] > 0:
             issues.append(f"{status_counts[HealthStatus.WARNING]} services with warnings")
-            recommendations.append("Monitor warning services closely")
+            recommendations.append(_REC_WARNING_SERVICES)
         
         self.system_report = HealthReport(
             status=overall_status,
             metrics=system_metrics,
             issues=issues,
-            recommendations=recommendations
+            recommendations=recommendations,
+            timestamp=timestamp
         )
     
+    def _queue_alert(self, service_id: str, status: HealthStatus, report: HealthReport):
+        """Hand an alert to the dispatcher thread, or send it inline when not started."""
+        alert_queue = self._alert_queue
+        if alert_queue is None:
+            self._send_alerts(service_id, status, report)
+            return
+        try:
+            alert_queue.put_nowait((service_id, status, report))
+        except queue.Full:
+            logger.warning(f"Alert queue full; dropping {status.value} alert for {service_id}")
+    
+    def _alert_loop(self):
+        """Deliver queued alerts to callbacks until stop() posts the sentinel."""
+        alert_queue = self._alert_queue
+        while True:
+            item = alert_queue.get()
+            if item is None:
+                break
+            self._send_alerts(*item)
+    
     def _send_alerts(self, service_id: str, status: HealthStatus, report: HealthReport):
         """Send alerts to registered callbacks."""
-        for callback in self.alert_callbacks:
-            try:
-                callback(service_id, status, report)
-            except Exception as e:
-                logger.error(f"Error in alert callback: {e}")
\ No newline at end of file
+        pool = self._alert_pool
+        if pool is None:
+            for callback in self.alert_callbacks:
+                self._run_alert_callback(callback, service_id, status, report)
+            return
+        
+        # Start the slowest callbacks first so cheap ones overlap with them
+        latency = self._callback_latency
+        callbacks = sorted(self.alert_callbacks, key=lambda cb: latency.get(cb, 0.0), reverse=True)
+        wait([pool.submit(self._run_alert_callback, callback, service_id, status, report)
+              for callback in callbacks])
+    
+    def _run_alert_callback(self, callback: Callable, service_id: str,
+                            status: HealthStatus, report: HealthReport):
+        """Invoke one alert callback and fold its duration into the latency average."""
+        started = time.perf_counter()
+        try:
+            callback(service_id, status, report)
+        except Exception as e:
+            logger.error(f"Error in alert callback: {e}")
+        elapsed = time.perf_counter() - started
+        previous = self._callback_latency.get(callback)
+        self._callback_latency[callback] = elapsed if previous is None else (
+            _CALLBACK_LATENCY_ALPHA * elapsed + (1 - _CALLBACK_LATENCY_ALPHA) * previous
+        )
\ No newline at end of file
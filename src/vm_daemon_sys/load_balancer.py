@@ -5,26 +5,36 @@ Provides intelligent load balancing across cognitive service instances.
 """
 
 import random
+import sys
 import threading
 import time
 from enum import Enum
-from typing import Dict, List, Optional, Tuple
+from functools import reduce
+from itertools import accumulate, count
+from math import gcd
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 from dataclasses import dataclass
 import logging
 
+import numpy as np
+
 from .service_manager import ServiceManager, ServiceType, ServiceStatus
 
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) only exists from Python 3.10
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
 class LoadBalancingStrategy(Enum):
     """Load balancing strategies."""
     ROUND_ROBIN = "round_robin"
     WEIGHTED_ROUND_ROBIN = "weighted_round_robin"
+    WEIGHTED_RANDOM = "weighted_random"
     LEAST_CONNECTIONS = "least_connections"
     LEAST_RESPONSE_TIME = "least_response_time"
     COGNITIVE_AWARE = "cognitive_aware"  # Custom strategy for cognitive workloads
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ServiceMetrics:
     """Metrics for a service instance."""
     instance_id: str
@@ -37,273 +47,389 @@ class ServiceMetrics:
     error_rate: float = 0.0
     last_updated: float = 0.0
 
+# Cognitive-aware score per (connections, response time ms, cognitive load, error rate):
+# 0.3 * connections/10 + 0.3 * seconds + 0.2 * load + 0.2 * error_rate*10
+_COGNITIVE_SCORE_WEIGHTS = np.array([0.3 / 10.0, 0.3 / 1000.0, 0.2, 0.2 * 10.0])
+_NO_FACTORS = (0.0, 0.0, 0.0, 0.0)
+
+# Weight penalties per (connections, response time ms, error rate, cognitive load)
+_WEIGHT_PENALTIES = np.array([0.1, 1.0 / 1000.0, 5.0, 0.5])
+
+# Number of locks the per-instance metric updates are spread across
+_METRIC_LOCK_STRIPES = 16
+
+# Smoothing factor for the response time and error rate moving averages
+_EMA_ALPHA = 0.1
+
+class _WeightedRoundRobinState:
+    """Interleaved weighted round robin position for one service type.
+    
+    Follows the LVS scheduler: the current weight steps down by the gcd of
+    the weights each pass, and an instance is picked while its weight is at
+    least the current weight. Each selection is O(n) with no allocation.
+    """
+    __slots__ = ('instance_ids', 'weights', 'index', 'current_weight', 'gcd_weight', 'max_weight')
+    
+    def __init__(self, instance_ids: Tuple[str, ...], weights: Tuple[int, ...]):
+        self.instance_ids = instance_ids
+        self.weights = weights
+        self.index = -1
+        self.current_weight = 0
+        self.gcd_weight = reduce(gcd, weights)
+        self.max_weight = max(weights)
+    
+    def next_index(self) -> int:
+        """Advance to the next instance to serve and return its index."""
+        size = len(self.weights)
+        while True:
+            self.index = (self.index + 1) % size
+            if self.index == 0:
+                self.current_weight -= self.gcd_weight
+                if self.current_weight <= 0:
+                    self.current_weight = self.max_weight
+            if self.weights[self.index] >= self.current_weight:
+                return self.index
+
 class LoadBalancer:
-    """Intelligent load balancer for cognitive services."""
+    """Intelligent load balancer for cognitive services.
+    
+    Readers never lock: metrics and weights are published by rebinding or
+    single-key stores, so a reader that grabs ``self.metrics`` once sees a
+    consistent dict. ``lock`` serializes changes to the dicts themselves;
+    per-request counter updates only take the striped lock of their instance.
+    """
     
     def __init__(self, strategy: LoadBalancingStrategy = LoadBalancingStrategy.ROUND_ROBIN,
                  service_manager: Optional[ServiceManager] = None):
         self.strategy = strategy
         self.service_manager = service_manager
         self.metrics: Dict[str, ServiceMetrics] = {}
-        self.round_robin_counters: Dict[ServiceType, int] = {}
         self.weights: Dict[str, float] = {}
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()
         
-        # Initialize round robin counters
-        for service_type in ServiceType:
-            self.round_robin_counters[service_type] = 0
+        # Round robin positions; next() on a count is atomic, so selection needs no lock
+        self._round_robin_counters: Dict[ServiceType, Iterator[int]] = {
+            service_type: count() for service_type in ServiceType
+        }
+        # Striped locks for per-instance counter updates; always taken before self.lock
+        self._metric_locks = [threading.Lock() for _ in range(_METRIC_LOCK_STRIPES)]
+        
+        # Weighted round robin schedulers, rebuilt when instances or weights change
+        self._wrr_states: Dict[ServiceType, _WeightedRoundRobinState] = {}
+        self._wrr_lock = threading.Lock()
+        # Cumulative weights for weighted random selection, keyed by service type and
+        # valid for the (weights dict, instance ids) they were built from
+        self._cum_weights: Dict[ServiceType, Tuple[Dict[str, float], Tuple[str, ...], List[float]]] = {}
+        
+        # Create metrics when instances start so the request path rarely allocates them
+        if service_manager is not None:
+            service_manager.add_status_callback(self._on_service_status_change)
     
     def select_service_instance(self, service_type: ServiceType, 
                               request_context: Optional[Dict] = None) -> Optional[str]:
         """Select the best service instance for a request."""
-        with self.lock:
-            if not self.service_manager:
-                logger.error("Service manager not available")
-                return None
-            
-            # Get healthy instances
-            healthy_instances = self.service_manager.get_healthy_services(service_type)
-            
-            if not healthy_instances:
-                logger.warning(f"No healthy instances available for {service_type.value}")
-                return None
-            
-            if len(healthy_instances) == 1:
-                return healthy_instances[0].config.instance_id
-            
-            # Apply load balancing strategy
-            if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
-                return self._round_robin_select(service_type, healthy_instances)
-            elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
-                return self._weighted_round_robin_select(service_type, healthy_instances)
-            elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
-                return self._least_connections_select(healthy_instances)
-            elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
-                return self._least_response_time_select(healthy_instances)
-            elif self.strategy == LoadBalancingStrategy.COGNITIVE_AWARE:
-                return self._cognitive_aware_select(healthy_instances, request_context)
-            else:
-                # Default to round robin
-                return self._round_robin_select(service_type, healthy_instances)
+        if not self.service_manager:
+            logger.error("Service manager not available")
+            return None
+        
+        # Get healthy instances
+        healthy_instances = self.service_manager.get_healthy_services(service_type)
+        
+        if not healthy_instances:
+            logger.warning(f"No healthy instances available for {service_type.value}")
+            return None
+        
+        if len(healthy_instances) == 1:
+            return healthy_instances[0].config.instance_id
+        
+        # Apply load balancing strategy
+        if self.strategy == LoadBalancingStrategy.ROUND_ROBIN:
+            return self._round_robin_select(service_type, healthy_instances)
+        elif self.strategy == LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN:
+            return self._weighted_round_robin_select(service_type, healthy_instances)
+        elif self.strategy == LoadBalancingStrategy.WEIGHTED_RANDOM:
+            return self._weighted_random_select(service_type, healthy_instances)
+        elif self.strategy == LoadBalancingStrategy.LEAST_CONNECTIONS:
+            return self._least_connections_select(healthy_instances)
+        elif self.strategy == LoadBalancingStrategy.LEAST_RESPONSE_TIME:
+            return self._least_response_time_select(healthy_instances)
+        elif self.strategy == LoadBalancingStrategy.COGNITIVE_AWARE:
+            return self._cognitive_aware_select(healthy_instances, request_context)
+        else:
+            # Default to round robin
+            return self._round_robin_select(service_type, healthy_instances)
     
     def update_service_metrics(self, instance_id: str, metrics: Dict):
         """Update metrics for a service instance."""
-        with self.lock:
-            current_time = time.time()
-            
-            if instance_id not in self.metrics:
-                self.metrics[instance_id] = ServiceMetrics(instance_id=instance_id)
-            
-            service_metrics = self.metrics[instance_id]
-            
-            # Update metrics
-            service_metrics.current_connections = metrics.get('connections', 0)
-            service_metrics.total_requests = metrics.get('total_requests', 0)
-            service_metrics.average_response_time = metrics.get('avg_response_time', 0.0)
-            service_metrics.cpu_usage = metrics.get('cpu_usage', 0.0)
-            service_metrics.memory_usage = metrics.get('memory_usage', 0.0)
-            service_metrics.cognitive_load = metrics.get('cognitive_load', 0.0)
-            service_metrics.error_rate = metrics.get('error_rate', 0.0)
-            service_metrics.last_updated = current_time
+        # Build the replacement outside the lock and publish it with one store
+        service_metrics = ServiceMetrics(
+            instance_id=instance_id,
+            current_connections=metrics.get('connections', 0),
+            total_requests=metrics.get('total_requests', 0),
+            average_response_time=metrics.get('avg_response_time', 0.0),
+            cpu_usage=metrics.get('cpu_usage', 0.0),
+            memory_usage=metrics.get('memory_usage', 0.0),
+            cognitive_load=metrics.get('cognitive_load', 0.0),
+            error_rate=metrics.get('error_rate', 0.0),
+            last_updated=time.time()
+        )
+        
+        with self._metric_lock(instance_id), self.lock:
+            self._publish_metrics(instance_id, service_metrics)
     
     def record_request_start(self, instance_id: str):
         """Record the start of a request to an instance."""
-        with self.lock:
-            if instance_id not in self.metrics:
-                self.metrics[instance_id] = ServiceMetrics(instance_id=instance_id)
-            
-            self.metrics[instance_id].current_connections += 1
+        service_metrics = self.metrics.get(instance_id)
+        if service_metrics is None:
+            service_metrics = self._ensure_metrics(instance_id)
+        
+        with self._metric_lock(instance_id):
+            # Re-read under the lock in case update_service_metrics swapped the entry
+            self.metrics.get(instance_id, service_metrics).current_connections += 1
     
     def record_request_end(self, instance_id: str, response_time: float, success: bool = True):
         """Record the completion of a request."""
-        with self.lock:
-            if instance_id not in self.metrics:
+        with self._metric_lock(instance_id):
+            metrics = self.metrics.get(instance_id)
+            if metrics is None:
                 return
             
-            metrics = self.metrics[instance_id]
-            metrics.current_connections = max(0, metrics.current_connections - 1)
-            metrics.total_requests += 1
-            
-            # Update average response time (exponential moving average)
-            alpha = 0.1  # Smoothing factor
-            metrics.average_response_time = (
-                alpha * response_time + 
-                (1 - alpha) * metrics.average_response_time
-            )
+            self._apply_request_end(metrics, response_time, success)
+    
+    def record_batch(self, updates: List[Tuple[str, float, bool]]):
+        """Record several request completions as (instance_id, response_time, success).
+        
+        Updates are grouped by lock stripe so each stripe is acquired once.
+        """
+        by_stripe: Dict[int, List[Tuple[str, float, bool]]] = {}
+        for update in updates:
+            by_stripe.setdefault(hash(update[0]) % _METRIC_LOCK_STRIPES, []).append(update)
+        
+        for stripe, stripe_updates in by_stripe.items():
+            with self._metric_locks[stripe]:
+                metrics_get = self.metrics.get
+                for instance_id, response_time, success in stripe_updates:
+                    metrics = metrics_get(instance_id)
+                    if metrics is not None:
+                        self._apply_request_end(metrics, response_time, success)
+    
+    def record_request_end_many(self, instance_id: str, response_times: Sequence[float],
+                                successes: Optional[Sequence[bool]] = None):
+        """Record several completed requests to one instance, oldest first.
+        
+        Matches calling record_request_end once per request, but folds the
+        moving averages in closed form with NumPy. Requests succeed unless
+        successes says otherwise.
+        """
+        response_times = np.asarray(response_times, dtype=np.float64)
+        count = len(response_times)
+        if count == 0:
+            return
+        
+        # Weight of each sample after all later samples have decayed it
+        decay = (1.0 - _EMA_ALPHA) ** np.arange(count - 1, -1, -1)
+        carry = (1.0 - _EMA_ALPHA) ** count
+        response_term = _EMA_ALPHA * float(decay @ response_times)
+        if successes is None:
+            error_term = 0.0
+        else:
+            failures = ~np.asarray(successes, dtype=bool)
+            error_term = _EMA_ALPHA * float(decay @ failures)
+        
+        with self._metric_lock(instance_id):
+            metrics = self.metrics.get(instance_id)
+            if metrics is None:
+                return
             
-            # Update error rate
-            if not success:
-                metrics.error_rate = alpha * 1.0 + (1 - alpha) * metrics.error_rate
-            else:
-                metrics.error_rate = (1 - alpha) * metrics.error_rate
+            metrics.current_connections = max(0, metrics.current_connections - count)
+            metrics.total_requests += count
+            metrics.average_response_time = carry * metrics.average_response_time + response_term
+            metrics.error_rate = carry * metrics.error_rate + error_term
+    
+    @staticmethod
+    def _apply_request_end(metrics: ServiceMetrics, response_time: float, success: bool):
+        """Fold one completed request into an instance's metrics; caller holds its lock."""
+        metrics.current_connections = max(0, metrics.current_connections - 1)
+        metrics.total_requests += 1
+        
+        # Update average response time (exponential moving average)
+        alpha = _EMA_ALPHA
+        metrics.average_response_time = (
+            alpha * response_time + 
+            (1 - alpha) * metrics.average_response_time
+        )
+        
+        # Update error rate
+        if not success:
+            metrics.error_rate = alpha * 1.0 + (1 - alpha) * metrics.error_rate
+        else:
+            metrics.error_rate = (1 - alpha) * metrics.error_rate
     
     def update_service_weights(self):
         """Update service weights based on current metrics."""
+        current_time = time.time()
+        
         with self.lock:
-            current_time = time.time()
+            weights = dict(self.weights)
+            # Skip stale metrics
+            fresh = [(instance_id, metrics) for instance_id, metrics in self.metrics.items()
+                     if current_time - metrics.last_updated <= 300]  # 5 minutes
+            
+            # Calculate weights based on performance, all instances at once
+            if fresh:
+                penalties = np.array([
+                    (metrics.current_connections, metrics.average_response_time,
+                     metrics.error_rate, metrics.cognitive_load)
+                    for _, metrics in fresh
+                ], dtype=float) @ _WEIGHT_PENALTIES
+                new_weights = np.maximum(0.1, 1.0 - penalties)
+                weights.update(zip((instance_id for instance_id, _ in fresh), new_weights.tolist()))
             
-            for instance_id, metrics in self.metrics.items():
-                # Skip stale metrics
-                if current_time - metrics.last_updated > 300:  # 5 minutes
-                    continue
-                
-                # Calculate weight based on performance
-                weight = self._calculate_instance_weight(metrics)
-                self.weights[instance_id] = weight
+            # Publish the new weights with a single reference swap
+            self.weights = weights
     
     def get_service_metrics(self, instance_id: str) -> Optional[ServiceMetrics]:
         """Get metrics for a service instance."""
-        with self.lock:
-            return self.metrics.get(instance_id)
+        return self.metrics.get(instance_id)
     
     def get_load_distribution(self, service_type: ServiceType) -> Dict[str, float]:
         """Get current load distribution for a service type."""
-        with self.lock:
-            if not self.service_manager:
-                return {}
-            
-            instances = self.service_manager.get_services_by_type(service_type)
-            distribution = {}
-            
-            total_load = 0
-            for instance in instances:
-                instance_id = instance.config.instance_id
-                if instance_id in self.metrics:
-                    load = self.metrics[instance_id].current_connections
-                    distribution[instance_id] = load
-                    total_load += load
-            
-            # Normalize to percentages
-            if total_load > 0:
-                for instance_id in distribution:
-                    distribution[instance_id] = (distribution[instance_id] / total_load) * 100
-            
-            return distribution
+        if not self.service_manager:
+            return {}
+        
+        metrics = self.metrics
+        instances = self.service_manager.get_services_by_type(service_type)
+        distribution = {}
+        
+        total_load = 0
+        for instance in instances:
+            instance_id = instance.config.instance_id
+            if instance_id in metrics:
+                load = metrics[instance_id].current_connections
+                distribution[instance_id] = load
+                total_load += load
+        
+        # Normalize to percentages
+        if total_load > 0:
+            for instance_id in distribution:
+                distribution[instance_id] = (distribution[instance_id] / total_load) * 100
+        
+        return distribution
+    
+    def _on_service_status_change(self, instance_id: str, status: ServiceStatus):
+        """Pre-create metrics for instances as they start."""
+        if status == ServiceStatus.STARTING and instance_id not in self.metrics:
+            self._ensure_metrics(instance_id)
+    
+    def _ensure_metrics(self, instance_id: str) -> ServiceMetrics:
+        """Return the metrics for an instance, publishing empty ones if it has none."""
+        # Allocate before locking; a concurrent creator may win, leaving this one unused
+        candidate = ServiceMetrics(instance_id=instance_id)
+        with self._metric_lock(instance_id):
+            existing = self.metrics.get(instance_id)
+            if existing is not None:
+                return existing
+            with self.lock:
+                self._publish_metrics(instance_id, candidate)
+            return candidate
+    
+    def _metric_lock(self, instance_id: str) -> threading.Lock:
+        """Lock guarding the counters of one instance's metrics."""
+        return self._metric_locks[hash(instance_id) % _METRIC_LOCK_STRIPES]
+    
+    def _publish_metrics(self, instance_id: str, service_metrics: ServiceMetrics):
+        """Store metrics for an instance; caller holds its metric lock and self.lock.
+        
+        Replacing an existing entry is a single dict store. A new instance
+        gets a copied dict so readers iterating the old one are unaffected.
+        """
+        if instance_id in self.metrics:
+            self.metrics[instance_id] = service_metrics
+        else:
+            # Key new instances by interned ids so later lookups compare by identity
+            if type(instance_id) is str:
+                instance_id = sys.intern(instance_id)
+                service_metrics.instance_id = instance_id
+            metrics = dict(self.metrics)
+            metrics[instance_id] = service_metrics
+            self.metrics = metrics
     
     def _round_robin_select(self, service_type: ServiceType, instances: List) -> str:
         """Round robin selection."""
-        counter = self.round_robin_counters[service_type]
-        selected = instances[counter % len(instances)]
-        self.round_robin_counters[service_type] = (counter + 1) % len(instances)
-        return selected.config.instance_id
+        counter = next(self._round_robin_counters[service_type])
+        return instances[counter % len(instances)].config.instance_id
     
     def _weighted_round_robin_select(self, service_type: ServiceType, instances: List) -> str:
         """Weighted round robin selection."""
-        # Calculate weights for each instance
-        weighted_instances = []
-        
-        for instance in instances:
-            instance_id = instance.config.instance_id
-            weight = self.weights.get(instance_id, 1.0)
-            # Add instance multiple times based on weight
-            count = max(1, int(weight * 10))
-            weighted_instances.extend([instance] * count)
+        # Integer weights: each instance gets max(1, int(weight * 10)) turns per cycle
+        weights = self.weights
+        instance_ids = tuple(instance.config.instance_id for instance in instances)
+        int_weights = tuple(max(1, int(weights.get(instance_id, 1.0) * 10))
+                            for instance_id in instance_ids)
         
-        if not weighted_instances:
-            return instances[0].config.instance_id
+        with self._wrr_lock:
+            state = self._wrr_states.get(service_type)
+            if state is None or state.instance_ids != instance_ids or state.weights != int_weights:
+                state = _WeightedRoundRobinState(instance_ids, int_weights)
+                self._wrr_states[service_type] = state
+            return instance_ids[state.next_index()]
+    
+    def _weighted_random_select(self, service_type: ServiceType, instances: List) -> str:
+        """Weighted random selection."""
+        # update_service_weights publishes a new dict, which invalidates the cached sums
+        weights = self.weights
+        instance_ids = tuple(instance.config.instance_id for instance in instances)
+        cached = self._cum_weights.get(service_type)
+        if cached is None or cached[0] is not weights or cached[1] != instance_ids:
+            cum_weights = list(accumulate(weights.get(instance_id, 1.0) for instance_id in instance_ids))
+            self._cum_weights[service_type] = (weights, instance_ids, cum_weights)
+        else:
+            cum_weights = cached[2]
         
-        # Use round robin on weighted list
-        counter = self.round_robin_counters[service_type]
-        selected = weighted_instances[counter % len(weighted_instances)]
-        self.round_robin_counters[service_type] = (counter + 1) % len(weighted_instances)
-        return selected.config.instance_id
+        return random.choices(instance_ids, cum_weights=cum_weights, k=1)[0]
     
     def _least_connections_select(self, instances: List) -> str:
         """Select instance with least connections."""
-        best_instance = None
-        min_connections = float('inf')
+        metrics_get = self.metrics.get
         
-        for instance in instances:
-            instance_id = instance.config.instance_id
-            connections = 0
-            
-            if instance_id in self.metrics:
-                connections = self.metrics[instance_id].current_connections
-            
-            if connections < min_connections:
-                min_connections = connections
-                best_instance = instance
+        def connections(instance_id: str) -> int:
+            metrics = metrics_get(instance_id)
+            return metrics.current_connections if metrics is not None else 0
         
-        return best_instance.config.instance_id if best_instance else instances[0].config.instance_id
+        # min() keeps the first instance among equals, like the original scan
+        return min((instance.config.instance_id for instance in instances), key=connections)
     
     def _least_response_time_select(self, instances: List) -> str:
         """Select instance with least average response time."""
-        best_instance = None
-        min_response_time = float('inf')
+        metrics_get = self.metrics.get
         
-        for instance in instances:
-            instance_id = instance.config.instance_id
-            response_time = float('inf')
-            
-            if instance_id in self.metrics:
-                response_time = self.metrics[instance_id].average_response_time
-                # If no response time data, use a default
-                if response_time == 0:
-                    response_time = 100.0  # Default 100ms
-            
-            if response_time < min_response_time:
-                min_response_time = response_time
-                best_instance = instance
+        def response_time(instance_id: str) -> float:
+            metrics = metrics_get(instance_id)
+            if metrics is None:
+                return float('inf')
+            # If no response time data, use a default of 100ms
+            return metrics.average_response_time or 100.0
         
-        return best_instance.config.instance_id if best_instance else instances[0].config.instance_id
+        return min((instance.config.instance_id for instance in instances), key=response_time)
     
     def _cognitive_aware_select(self, instances: List, request_context: Optional[Dict] = None) -> str:
         """Cognitive-aware selection considering workload complexity."""
-        best_instance = None
-        best_score = float('inf')
-        
         # Get request complexity
         request_complexity = 1.0
         if request_context:
             request_complexity = request_context.get('complexity', 1.0)
         
-        for instance in instances:
-            instance_id = instance.config.instance_id
-            
-            if instance_id not in self.metrics:
-                # No metrics available, use default score
-                score = request_complexity
-            else:
-                metrics = self.metrics[instance_id]
-                
-                # Calculate composite score considering multiple factors
-                connection_factor = metrics.current_connections / 10.0
-                response_time_factor = metrics.average_response_time / 1000.0  # Normalize to seconds
-                cognitive_load_factor = metrics.cognitive_load
-                error_factor = metrics.error_rate * 10.0
-                
-                # Weighted combination
-                score = (
-                    0.3 * connection_factor +
-                    0.3 * response_time_factor + 
-                    0.2 * cognitive_load_factor +
-                    0.2 * error_factor
-                ) * request_complexity
-            
-            if score < best_score:
-                best_score = score
-                best_instance = instance
-        
-        return best_instance.config.instance_id if best_instance else instances[0].config.instance_id
-    
-    def _calculate_instance_weight(self, metrics: ServiceMetrics) -> float:
-        """Calculate weight for an instance based on its metrics."""
-        # Higher weight means better performance
-        base_weight = 1.0
-        
-        # Reduce weight based on current load
-        connection_penalty = metrics.current_connections * 0.1
-        
-        # Reduce weight based on response time
-        response_time_penalty = metrics.average_response_time / 1000.0  # Convert to seconds
-        
-        # Reduce weight based on error rate
-        error_penalty = metrics.error_rate * 5.0
-        
-        # Reduce weight based on cognitive load
-        cognitive_penalty = metrics.cognitive_load * 0.5
-        
-        weight = max(0.1, base_weight - connection_penalty - response_time_penalty - 
-                    error_penalty - cognitive_penalty)
+        # Gather metric columns for all candidates and score them in one pass
+        metrics_get = self.metrics.get
+        gathered = [metrics_get(instance.config.instance_id) for instance in instances]
+        has_metrics = np.fromiter((metrics is not None for metrics in gathered),
+                                  dtype=bool, count=len(gathered))
+        factors = np.array([
+            (metrics.current_connections, metrics.average_response_time,
+             metrics.cognitive_load, metrics.error_rate) if metrics is not None else _NO_FACTORS
+            for metrics in gathered
+        ], dtype=float)
         
-        return weight
\ No newline at end of file
+        # Instances without metrics get the default score
+        scores = np.where(has_metrics, factors @ _COGNITIVE_SCORE_WEIGHTS, 1.0) * request_complexity
+        return instances[int(np.argmin(scores))].config.instance_id
@@ -5,11 +5,16 @@ High-level orchestration and coordination of cognitive services.
 """
 
 import asyncio
+import itertools
 import logging
-from typing import Dict, List, Optional, Any, Tuple
+import time
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
 import json
+import re
+import sys
 
 from .service_manager import ServiceManager, ServiceType, ServiceStatus
 from .load_balancer import LoadBalancer
@@ -17,7 +22,112 @@ from .health_monitor import HealthMonitor, HealthStatus
 
 logger = logging.getLogger(__name__)
 
-@dataclass
+# Request and response objects are created per call; slot them where supported (3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Services each request type is routed through
+_REQUEST_TYPE_TO_SERVICES: Dict[str, Tuple[ServiceType, ...]] = {
+    "relevance_analysis": (ServiceType.RELEVANCE,),
+    "wisdom_evaluation": (ServiceType.WISDOM,),
+    "rational_analysis": (ServiceType.RATIONALITY,),
+    "phenomenological_processing": (ServiceType.PHENOMENOLOGY,),
+    "meaning_making": (ServiceType.MEANING_MAKING,),
+    "integration": (ServiceType.INTEGRATION,),
+    "silicon_sage_advice": (ServiceType.SILICON_SAGE,),
+    # Use multiple services for comprehensive analysis
+    "comprehensive_analysis": (
+        ServiceType.RELEVANCE,
+        ServiceType.WISDOM,
+        ServiceType.RATIONALITY,
+        ServiceType.MEANING_MAKING,
+        ServiceType.INTEGRATION
+    ),
+}
+_DEFAULT_SERVICES = (ServiceType.SILICON_SAGE,)
+
+# Services whose results a service builds on; services in a pipeline that
+# don't depend on each other run concurrently
+_SERVICE_DEPENDENCIES: Dict[ServiceType, Tuple[ServiceType, ...]] = {
+    ServiceType.INTEGRATION: (
+        ServiceType.RELEVANCE,
+        ServiceType.WISDOM,
+        ServiceType.RATIONALITY,
+        ServiceType.PHENOMENOLOGY,
+        ServiceType.MEANING_MAKING
+    ),
+}
+
+# Simulated service responses. Nested values are one level deep, so copying
+# each dict/list gives callers a response they can mutate freely.
+_SERVICE_RESPONSES: Dict[ServiceType, Mapping[str, Any]] = {
+    ServiceType.RELEVANCE: MappingProxyType({
+        'relevance_scores': {'key_concept_1': 0.8, 'key_concept_2': 0.6},
+        'salience_weights': {'attention': 0.7, 'working_memory': 0.5}
+    }),
+    ServiceType.WISDOM: MappingProxyType({
+        'wisdom_metrics': {
+            'inference': 0.75,
+            'insight': 0.65,
+            'intuition': 0.55,
+            'understanding': 0.80
+        },
+        'recommendations': ['Consider multiple perspectives', 'Balance analysis with intuition']
+    }),
+    ServiceType.RATIONALITY: MappingProxyType({
+        'rationality_metrics': {
+            'logical_coherence': 0.85,
+            'evidence_quality': 0.70,
+            'argument_strength': 0.75
+        },
+        'logical_analysis': 'The argument follows a coherent structure...'
+    }),
+    ServiceType.PHENOMENOLOGY: MappingProxyType({
+        'experiential_depth': 0.65,
+        'participatory_knowing': 0.70,
+        'meaning_resonance': 0.75
+    }),
+    ServiceType.MEANING_MAKING: MappingProxyType({
+        'message_confidence': 0.85,
+        'meaning_depth': 0.80
+    }),
+    ServiceType.INTEGRATION: MappingProxyType({
+        'integration_level': 0.75,
+        'synergistic_patterns': ['pattern_1', 'pattern_2'],
+        'emergent_insights': ['insight_1', 'insight_2']
+    }),
+    # SiliconSage provides comprehensive response
+    ServiceType.SILICON_SAGE: MappingProxyType({
+        'message_confidence': 0.85,
+        'wisdom_metrics': {
+            'inference': 0.75,
+            'insight': 0.65,
+            'understanding': 0.80
+        },
+        'rationality_metrics': {
+            'logical_coherence': 0.85,
+            'evidence_quality': 0.70
+        },
+        'ecology_metrics': {
+            'integration_level': 0.75,
+            'optimization_depth': 0.70
+        },
+        'recommendations': [
+            'Consider multiple cognitive perspectives',
+            'Balance rational analysis with intuitive insights',
+            'Integrate findings across domains'
+        ]
+    }),
+}
+# Services whose response includes the request content as a refined message
+_REFINED_MESSAGE_PREFIXES: Dict[ServiceType, str] = {
+    ServiceType.MEANING_MAKING: "Enhanced: ",
+    ServiceType.SILICON_SAGE: "Sage wisdom: ",
+}
+
+# Content complexity indicators, matched anywhere in the message
+_COMPLEX_TERMS_RE = re.compile(r"meaning|wisdom|consciousness|phenomenology|relevance", re.IGNORECASE)
+
+@dataclass(**_DATACLASS_SLOTS)
 class CognitiveRequest:
     """Request for cognitive processing."""
     request_id: str
@@ -35,7 +145,7 @@ class CognitiveRequest:
         if self.required_services is None:
             self.required_services = []
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class CognitiveResponse:
     """Response from cognitive processing."""
     request_id: str
@@ -57,7 +167,11 @@ class CognitiveOrchestrator:
         self.service_manager = service_manager
         self.load_balancer = load_balancer
         self.active_requests: Dict[str, CognitiveRequest] = {}
-        self.request_queue: List[CognitiveRequest] = []
+        # Pending requests as (-priority, sequence, request): highest priority first, FIFO within a priority
+        self.request_queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        self._request_seq = itertools.count()
+        # Source of unique SiliconSage request ids
+        self._sage_request_ids = itertools.count()
         self.processing_stats = {
             'total_requests': 0,
             'successful_requests': 0,
@@ -67,7 +181,7 @@ class CognitiveOrchestrator:
     
     async def process_request(self, request: CognitiveRequest) -> CognitiveResponse:
         """Process a cognitive request through the appropriate services."""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         self.active_requests[request.request_id] = request
         self.processing_stats['total_requests'] += 1
         
@@ -85,7 +199,7 @@ class CognitiveOrchestrator:
             result = await self._execute_pipeline(request, pipeline)
             
             # Calculate processing time
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             
             # Create response
             response = CognitiveResponse(
@@ -105,7 +219,7 @@ class CognitiveOrchestrator:
             return response
             
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"Error processing request {request.request_id}: {e}")
             
             # Update stats
@@ -125,11 +239,23 @@ class CognitiveOrchestrator:
             # Clean up
             self.active_requests.pop(request.request_id, None)
     
+    async def enqueue_request(self, request: CognitiveRequest):
+        """Queue a request for later processing, ordered by priority."""
+        await self.request_queue.put((-request.priority, next(self._request_seq), request))
+    
+    async def process_next_request(self) -> CognitiveResponse:
+        """Wait for the highest-priority queued request and process it."""
+        _, _, request = await self.request_queue.get()
+        try:
+            return await self.process_request(request)
+        finally:
+            self.request_queue.task_done()
+    
     async def process_silicon_sage_request(self, message: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Process a request through the SiliconSage orchestrator."""
         # Create cognitive request
         request = CognitiveRequest(
-            request_id=f"sage_{datetime.now().timestamp()}",
+            request_id=f"sage_{next(self._sage_request_ids):x}",
             request_type="silicon_sage_advice",
             content=message,
             context=context,
@@ -170,35 +296,8 @@ class CognitiveOrchestrator:
     
     def _determine_required_services(self, request: CognitiveRequest) -> List[ServiceType]:
         """Determine which services are required for a request."""
-        required_services = []
-        
-        # Basic mapping based on request type
-        if request.request_type == "relevance_analysis":
-            required_services = [ServiceType.RELEVANCE]
-        elif request.request_type == "wisdom_evaluation":
-            required_services = [ServiceType.WISDOM]
-        elif request.request_type == "rational_analysis":
-            required_services = [ServiceType.RATIONALITY]
-        elif request.request_type == "phenomenological_processing":
-            required_services = [ServiceType.PHENOMENOLOGY]
-        elif request.request_type == "meaning_making":
-            required_services = [ServiceType.MEANING_MAKING]
-        elif request.request_type == "integration":
-            required_services = [ServiceType.INTEGRATION]
-        elif request.request_type == "silicon_sage_advice":
-            required_services = [ServiceType.SILICON_SAGE]
-        elif request.request_type == "comprehensive_analysis":
-            # Use multiple services for comprehensive analysis
-            required_services = [
-                ServiceType.RELEVANCE,
-                ServiceType.WISDOM,
-                ServiceType.RATIONALITY,
-                ServiceType.MEANING_MAKING,
-                ServiceType.INTEGRATION
-            ]
-        else:
-            # Default to SiliconSage for unknown request types
-            required_services = [ServiceType.SILICON_SAGE]
+        # Basic mapping based on request type; unknown types default to SiliconSage
+        required_services = list(_REQUEST_TYPE_TO_SERVICES.get(request.request_type, _DEFAULT_SERVICES))
         
         # Consider complexity for additional services
         if request.complexity > 0.7:
@@ -211,16 +310,17 @@ class CognitiveOrchestrator:
         """Plan the processing pipeline for a request."""
         pipeline = []
         
+        # Request context for load balancer, the same for every service
+        lb_context = {
+            'complexity': request.complexity,
+            'priority': request.priority,
+            'request_type': request.request_type
+        }
+        select_instance = self.load_balancer.select_service_instance
+        
         # For each required service, select the best instance
         for service_type in request.required_services:
-            # Create request context for load balancer
-            lb_context = {
-                'complexity': request.complexity,
-                'priority': request.priority,
-                'request_type': request.request_type
-            }
-            
-            instance_id = self.load_balancer.select_service_instance(service_type, lb_context)
+            instance_id = select_instance(service_type, lb_context)
             if instance_id:
                 pipeline.append(instance_id)
             else:
@@ -229,137 +329,120 @@ class CognitiveOrchestrator:
         return pipeline
     
     async def _execute_pipeline(self, request: CognitiveRequest, pipeline: List[str]) -> Dict[str, Any]:
-        """Execute the processing pipeline."""
+        """Execute the processing pipeline.
+        
+        Services run in dependency stages: every service in a stage runs
+        concurrently and sees the results of the earlier stages.
+        """
         result = {}
         intermediate_results = {}
+        run_step = self._run_pipeline_step
         
-        for instance_id in pipeline:
+        for stage in self._group_pipeline_stages(pipeline):
+            # Completions are reported to the load balancer in one batch per stage
+            completions: List[Tuple[str, float, bool]] = []
             try:
-                # Get service type for this instance
-                instance = self.service_manager.services.get(instance_id)
-                if not instance:
-                    logger.error(f"Instance not found: {instance_id}")
+                stage_results = await asyncio.gather(*(
+                    run_step(request, instance_id, service_type, intermediate_results, completions)
+                    for instance_id, service_type in stage
+                ))
+            finally:
+                if completions:
+                    self.load_balancer.record_batch(completions)
+            
+            # Store results in pipeline order
+            for (instance_id, service_type), service_result in zip(stage, stage_results):
+                if service_result is None:
                     continue
-                
-                service_type = instance.config.service_type
-                
-                # Record request start for load balancing
-                self.load_balancer.record_request_start(instance_id)
-                
-                start_time = datetime.now()
-                
-                # Process with this service
-                service_result = await self._process_with_service(
-                    service_type, 
-                    request.content, 
-                    request.context,
-                    intermediate_results
-                )
-                
-                # Record request completion
-                processing_time = (datetime.now() - start_time).total_seconds() * 1000  # ms
-                self.load_balancer.record_request_end(instance_id, processing_time, True)
-                
-                # Store result
                 intermediate_results[service_type.value] = service_result
                 result.update(service_result)
-                
-                logger.debug(f"Processed with {service_type.value}: {instance_id}")
-                
-            except Exception as e:
-                logger.error(f"Error processing with {instance_id}: {e}")
-                
-                # Record failed request
-                processing_time = 5000  # Default for failed requests
-                self.load_balancer.record_request_end(instance_id, processing_time, False)
-                
-                # Continue with other services
-                continue
         
         return result
     
+    def _group_pipeline_stages(self, pipeline: List[str]) -> List[List[Tuple[str, ServiceType]]]:
+        """Group pipeline instances into stages that respect service dependencies."""
+        services_get = self.service_manager.services.get
+        steps = []
+        for instance_id in pipeline:
+            # Get service type for this instance
+            instance = services_get(instance_id)
+            if not instance:
+                logger.error(f"Instance not found: {instance_id}")
+                continue
+            steps.append((instance_id, instance.config.service_type))
+        
+        # A service runs one stage after the latest of its dependencies in this pipeline
+        present = {service_type for _, service_type in steps}
+        levels: Dict[ServiceType, int] = {}
+        
+        def level(service_type: ServiceType) -> int:
+            if service_type not in levels:
+                deps = _SERVICE_DEPENDENCIES.get(service_type, ())
+                levels[service_type] = 1 + max((level(dep) for dep in deps if dep in present), default=-1)
+            return levels[service_type]
+        
+        stages: Dict[int, List[Tuple[str, ServiceType]]] = {}
+        for step in steps:
+            stages.setdefault(level(step[1]), []).append(step)
+        return [stages[index] for index in sorted(stages)]
+    
+    async def _run_pipeline_step(self, request: CognitiveRequest, instance_id: str,
+                                 service_type: ServiceType,
+                                 intermediate_results: Dict[str, Any],
+                                 completions: List[Tuple[str, float, bool]]) -> Optional[Dict[str, Any]]:
+        """Process a request with one pipeline instance; returns None if it failed.
+        
+        The step's (instance_id, time in ms, success) is appended to completions.
+        """
+        try:
+            # Record request start for load balancing
+            self.load_balancer.record_request_start(instance_id)
+            
+            start_ns = time.perf_counter_ns()
+            
+            # Process with this service
+            service_result = await self._process_with_service(
+                service_type, 
+                request.content, 
+                request.context,
+                intermediate_results
+            )
+            
+            # Record request completion
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e6  # ms
+            completions.append((instance_id, processing_time, True))
+            
+            logger.debug(f"Processed with {service_type.value}: {instance_id}")
+            return service_result
+            
+        except Exception as e:
+            logger.error(f"Error processing with {instance_id}: {e}")
+            
+            # Record failed request
+            processing_time = 5000  # Default for failed requests
+            completions.append((instance_id, processing_time, False))
+            
+            # Continue with other services
+            return None
+    
     async def _process_with_service(self, service_type: ServiceType, content: str, 
                                   context: Dict[str, Any], 
                                   intermediate_results: Dict[str, Any]) -> Dict[str, Any]:
         """Process content with a specific service."""
         # In a real implementation, this would make HTTP requests to the service
         # For simulation, we'll return appropriate mock responses
-        
-        if service_type == ServiceType.RELEVANCE:
-            return {
-                'relevance_scores': {'key_concept_1': 0.8, 'key_concept_2': 0.6},
-                'salience_weights': {'attention': 0.7, 'working_memory': 0.5}
-            }
-        
-        elif service_type == ServiceType.WISDOM:
-            return {
-                'wisdom_metrics': {
-                    'inference': 0.75,
-                    'insight': 0.65,
-                    'intuition': 0.55,
-                    'understanding': 0.80
-                },
-                'recommendations': ['Consider multiple perspectives', 'Balance analysis with intuition']
-            }
-        
-        elif service_type == ServiceType.RATIONALITY:
-            return {
-                'rationality_metrics': {
-                    'logical_coherence': 0.85,
-                    'evidence_quality': 0.70,
-                    'argument_strength': 0.75
-                },
-                'logical_analysis': 'The argument follows a coherent structure...'
-            }
-        
-        elif service_type == ServiceType.PHENOMENOLOGY:
-            return {
-                'experiential_depth': 0.65,
-                'participatory_knowing': 0.70,
-                'meaning_resonance': 0.75
-            }
-        
-        elif service_type == ServiceType.MEANING_MAKING:
-            return {
-                'refined_message': f"Enhanced: {content}",
-                'message_confidence': 0.85,
-                'meaning_depth': 0.80
-            }
-        
-        elif service_type == ServiceType.INTEGRATION:
-            return {
-                'integration_level': 0.75,
-                'synergistic_patterns': ['pattern_1', 'pattern_2'],
-                'emergent_insights': ['insight_1', 'insight_2']
-            }
-        
-        elif service_type == ServiceType.SILICON_SAGE:
-            # SiliconSage provides comprehensive response
-            return {
-                'refined_message': f"Sage wisdom: {content}",
-                'message_confidence': 0.85,
-                'wisdom_metrics': {
-                    'inference': 0.75,
-                    'insight': 0.65,
-                    'understanding': 0.80
-                },
-                'rationality_metrics': {
-                    'logical_coherence': 0.85,
-                    'evidence_quality': 0.70
-                },
-                'ecology_metrics': {
-                    'integration_level': 0.75,
-                    'optimization_depth': 0.70
-                },
-                'recommendations': [
-                    'Consider multiple cognitive perspectives',
-                    'Balance rational analysis with intuitive insights',
-                    'Integrate findings across domains'
-                ]
-            }
-        
-        else:
+        template = _SERVICE_RESPONSES.get(service_type)
+        if template is None:
             return {'error': f'Unknown service type: {service_type.value}'}
+        
+        response = {
+            key: value.copy() if isinstance(value, (dict, list)) else value
+            for key, value in template.items()
+        }
+        prefix = _REFINED_MESSAGE_PREFIXES.get(service_type)
+        if prefix is not None:
+            response['refined_message'] = prefix + content
+        return response
     
     def _estimate_complexity(self, message: str, context: Dict[str, Any]) -> float:
         """Estimate the cognitive complexity of a request."""
@@ -379,19 +462,18 @@ class CognitiveOrchestrator:
         elif context_size > 2:
             complexity += 0.1
         
-        # Content complexity indicators
-        complex_terms = ['meaning', 'wisdom', 'consciousness', 'phenomenology', 'relevance']
-        for term in complex_terms:
-            if term in message.lower():
-                complexity += 0.1
+        # Content complexity indicators, each distinct term counted once
+        terms_found = {term.lower() for term in _COMPLEX_TERMS_RE.findall(message)}
+        complexity += 0.1 * len(terms_found)
         
         return min(1.0, complexity)
     
     def _update_average_processing_time(self, processing_time: float):
         """Update the average processing time statistic."""
-        total_requests = self.processing_stats['total_requests']
-        current_avg = self.processing_stats['average_processing_time']
+        stats = self.processing_stats
+        # Average over completed requests; requests still in flight are already in total_requests
+        completed = stats['successful_requests'] + stats['failed_requests']
+        current_avg = stats['average_processing_time']
         
-        # Calculate new average
-        new_avg = ((current_avg * (total_requests - 1)) + processing_time) / total_requests
-        self.processing_stats['average_processing_time'] = new_avg
\ No newline at end of file
+        # Incremental mean update
+        stats['average_processing_time'] = current_avg + (processing_time - current_avg) / completed
\ No newline at end of file
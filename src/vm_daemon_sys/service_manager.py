@@ -5,17 +5,30 @@ Manages lifecycle, configuration, and coordination of cognitive services.
 """
 
 import asyncio
+import heapq
 import logging
+import sys
 import threading
 import time
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Set, Tuple
 from datetime import datetime, timedelta
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 
 logger = logging.getLogger(__name__)
 
+# Use slots where dataclass supports them (Python 3.10+)
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Upper bound on concurrent health checks; the executor only spawns threads as needed
+_HEALTH_CHECK_WORKERS = 32
+# Concurrent restarts of unhealthy services; further restarts wait in the pool's queue
+_RESTART_WORKERS = 4
+# Floor on health_check_interval so a misconfigured service cannot spin the monitor
+_MIN_HEALTH_CHECK_INTERVAL = 5
+
 class ServiceType(Enum):
     """Types of cognitive services."""
     RELEVANCE = "relevance"
@@ -35,7 +48,10 @@ class ServiceStatus(Enum):
     ERROR = "error"
     MAINTENANCE = "maintenance"
 
-@dataclass
+# Statuses in which a service has a live process that must be stopped
+_ACTIVE_STATUSES = frozenset({ServiceStatus.RUNNING, ServiceStatus.STARTING})
+
+@dataclass(**_DATACLASS_SLOTS)
 class ServiceConfig:
     """Configuration for a cognitive service."""
     service_type: ServiceType
@@ -49,10 +65,16 @@ class ServiceConfig:
     dependencies: List[ServiceType] = field(default_factory=list)
     auto_restart: bool = True
     health_check_interval: int = 30  # seconds
+    health_check_timeout: int = 10  # seconds, capped by the check interval
     startup_timeout: int = 60  # seconds
     shutdown_timeout: int = 30  # seconds
+    
+    def __post_init__(self):
+        # Interned ids hash and compare by identity in the many dicts keyed on them
+        if type(self.instance_id) is str:
+            self.instance_id = sys.intern(self.instance_id)
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class ServiceInstance:
     """Represents a running service instance."""
     config: ServiceConfig
@@ -70,13 +92,34 @@ class ServiceManager:
     
     def __init__(self, config_file: Optional[str] = None):
         self.services: Dict[str, ServiceInstance] = {}
-        self.service_registry: Dict[ServiceType, List[str]] = {
-            service_type: [] for service_type in ServiceType
+        # Immutable instance tuples replaced on change, so readers can iterate them without locking
+        self.service_registry: Dict[ServiceType, Tuple[ServiceInstance, ...]] = {
+            service_type: () for service_type in ServiceType
         }
-        self.status_callbacks: List[Callable[[str, ServiceStatus], None]] = []
+        # Running, healthy instances per type; replaced on change like service_registry
+        self._healthy_by_type: Dict[ServiceType, Dict[str, ServiceInstance]] = {
+            service_type: {} for service_type in ServiceType
+        }
+        # Replaced rather than appended to, so notifications iterate a stable tuple
+        self.status_callbacks: Tuple[Callable[[str, ServiceStatus], None], ...] = ()
+        # Guards the registry structures; per-instance locks guard lifecycle changes
         self.lock = threading.RLock()
+        self._instance_locks: Dict[str, threading.RLock] = {}
         self.running = False
         self._monitor_thread: Optional[threading.Thread] = None
+        # Event loop hosting the monitor task and the event used to wake it for shutdown
+        self._monitor_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._monitor_wakeup: Optional[asyncio.Event] = None
+        self._hc_pool = ThreadPoolExecutor(max_workers=_HEALTH_CHECK_WORKERS,
+                                           thread_name_prefix="svc-health")
+        self._restart_pool = ThreadPoolExecutor(max_workers=_RESTART_WORKERS,
+                                                thread_name_prefix="svc-restart")
+        # Pending checks as (monotonic due time, instance id); _hc_due holds each
+        # instance's current deadline so superseded heap entries can be skipped
+        self._hc_heap: List[Tuple[float, str]] = []
+        self._hc_due: Dict[str, float] = {}
+        # Probes in flight on the monitor loop, held so they are not collected early
+        self._hc_tasks: Set[asyncio.Task] = set()
         
         # Load configuration if provided
         if config_file:
@@ -88,42 +131,59 @@ class ServiceManager:
             instance = ServiceInstance(config=config)
             instance_id = config.instance_id
             
+            previous = self.services.get(instance_id)
+            if previous is not None:
+                self._remove_from_registry(previous)
+                self._update_health_index(instance_id, previous, healthy=False)
+            
             self.services[instance_id] = instance
-            self.service_registry[config.service_type].append(instance_id)
+            self.service_registry[config.service_type] += (instance,)
+            # Re-registration keeps the lock other threads may already hold
+            self._instance_locks.setdefault(instance_id, threading.RLock())
             
             logger.info(f"Registered service {config.service_type.value} with ID {instance_id}")
             return instance_id
     
     def unregister_service(self, instance_id: str) -> bool:
         """Unregister a service."""
-        with self.lock:
-            if instance_id not in self.services:
+        lock = self._instance_lock(instance_id)
+        if lock is None:
+            return False
+        
+        with lock:
+            instance = self.services.get(instance_id)
+            if instance is None:
                 return False
             
-            instance = self.services[instance_id]
-            
             # Stop service if running
-            if instance.status in [ServiceStatus.RUNNING, ServiceStatus.STARTING]:
+            if instance.status in _ACTIVE_STATUSES:
                 self.stop_service(instance_id)
             
-            # Remove from registry
-            service_type = instance.config.service_type
-            if instance_id in self.service_registry[service_type]:
-                self.service_registry[service_type].remove(instance_id)
+            with self.lock:
+                # Remove from registry
+                self._remove_from_registry(instance)
+                
+                del self.services[instance_id]
+                self._update_health_index(instance_id, instance, healthy=False)
+                self._instance_locks.pop(instance_id, None)
+                self._hc_due.pop(instance_id, None)
             
-            del self.services[instance_id]
             logger.info(f"Unregistered service {instance_id}")
             return True
     
     def start_service(self, instance_id: str) -> bool:
         """Start a specific service instance."""
-        with self.lock:
-            if instance_id not in self.services:
+        lock = self._instance_lock(instance_id)
+        if lock is None:
+            logger.error(f"Service {instance_id} not found")
+            return False
+        
+        with lock:
+            instance = self.services.get(instance_id)
+            if instance is None:
                 logger.error(f"Service {instance_id} not found")
                 return False
             
-            instance = self.services[instance_id]
-            
             if instance.status != ServiceStatus.STOPPED:
                 logger.warning(f"Service {instance_id} is not stopped (status: {instance.status})")
                 return False
@@ -144,6 +204,7 @@ class ServiceManager:
                 
                 if success:
                     instance.status = ServiceStatus.RUNNING
+                    self._schedule_health_check(instance_id, time.monotonic())
                     logger.info(f"Started service {instance_id}")
                 else:
                     instance.status = ServiceStatus.ERROR
@@ -162,17 +223,24 @@ class ServiceManager:
     
     def stop_service(self, instance_id: str) -> bool:
         """Stop a specific service instance."""
-        with self.lock:
-            if instance_id not in self.services:
+        lock = self._instance_lock(instance_id)
+        if lock is None:
+            logger.error(f"Service {instance_id} not found")
+            return False
+        
+        with lock:
+            instance = self.services.get(instance_id)
+            if instance is None:
                 logger.error(f"Service {instance_id} not found")
                 return False
             
-            instance = self.services[instance_id]
-            
-            if instance.status not in [ServiceStatus.RUNNING, ServiceStatus.STARTING]:
+            if instance.status not in _ACTIVE_STATUSES:
                 logger.warning(f"Service {instance_id} is not running (status: {instance.status})")
                 return False
             
+            with self.lock:
+                self._hc_due.pop(instance_id, None)
+            
             try:
                 instance.status = ServiceStatus.STOPPING
                 self._notify_status_change(instance_id, instance.status)
@@ -204,29 +272,46 @@ class ServiceManager:
         if self.stop_service(instance_id):
             time.sleep(1)  # Brief pause
             if self.start_service(instance_id):
-                with self.lock:
-                    self.services[instance_id].restart_count += 1
+                lock = self._instance_lock(instance_id)
+                if lock is not None:
+                    with lock:
+                        instance = self.services.get(instance_id)
+                        if instance is not None:
+                            instance.restart_count += 1
                 return True
         return False
     
     def get_service_status(self, instance_id: str) -> Optional[ServiceStatus]:
         """Get the status of a service instance."""
-        with self.lock:
-            return self.services.get(instance_id, {}).status if instance_id in self.services else None
+        lock = self._instance_lock(instance_id)
+        if lock is None:
+            return None
+        
+        with lock:
+            instance = self.services.get(instance_id)
+            return instance.status if instance is not None else None
     
     def get_services_by_type(self, service_type: ServiceType) -> List[ServiceInstance]:
         """Get all service instances of a specific type."""
+        return list(self.service_registry.get(service_type, ()))
+    
+    def snapshot_by_type(self) -> Dict[ServiceType, List[ServiceInstance]]:
+        """Get all service instances grouped by type in a single pass."""
+        return {service_type: list(instances)
+                for service_type, instances in self.service_registry.items()}
+    
+    def get_metrics_batch(self, instance_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """Get the latest reported metrics for several service instances in one call."""
+        # In a real implementation, this would issue a single backend query
         with self.lock:
-            instance_ids = self.service_registry.get(service_type, [])
-            return [self.services[instance_id] for instance_id in instance_ids 
-                   if instance_id in self.services]
+            services = self.services
+            return {instance_id: dict(instance.metrics)
+                    for instance_id, instance in zip(instance_ids, map(services.get, instance_ids))
+                    if instance is not None}
     
     def get_healthy_services(self, service_type: ServiceType) -> List[ServiceInstance]:
         """Get all healthy running services of a specific type."""
-        services = self.get_services_by_type(service_type)
-        return [service for service in services 
-               if service.status == ServiceStatus.RUNNING and 
-               service.health_status == "healthy"]
+        return list(self._healthy_by_type[service_type].values())
     
     def start_monitoring(self):
         """Start the service monitoring thread."""
@@ -234,26 +319,46 @@ class ServiceManager:
             return
         
         self.running = True
-        self._monitor_thread = threading.Thread(target=self._monitor_services, daemon=True)
+        self._monitor_thread = threading.Thread(
+            target=lambda: asyncio.run(self._monitor_services()), daemon=True)
         self._monitor_thread.start()
         logger.info("Started service monitoring")
     
     def stop_monitoring(self):
         """Stop the service monitoring thread."""
         self.running = False
+        self._wake_monitor()
         if self._monitor_thread:
             self._monitor_thread.join(timeout=5)
         logger.info("Stopped service monitoring")
     
+    def close(self):
+        """Stop monitoring and release the resources shared by health checks."""
+        self.stop_monitoring()
+        self._hc_pool.shutdown(wait=False)
+        self._restart_pool.shutdown(wait=False)
+    
     def add_status_callback(self, callback: Callable[[str, ServiceStatus], None]):
         """Add a callback for status changes."""
-        self.status_callbacks.append(callback)
+        with self.lock:
+            self.status_callbacks += (callback,)
     
     def load_config(self, config_file: str):
         """Load service configurations from file."""
         # Implementation would load from YAML/JSON config file
         pass
     
+    def _remove_from_registry(self, instance: ServiceInstance):
+        """Drop an instance from its type's registry tuple; the caller holds self.lock."""
+        service_type = instance.config.service_type
+        self.service_registry[service_type] = tuple(
+            registered for registered in self.service_registry[service_type]
+            if registered is not instance)
+    
+    def _instance_lock(self, instance_id: str) -> Optional[threading.RLock]:
+        """Get the lock guarding one instance's lifecycle, or None if it is not registered."""
+        return self._instance_locks.get(instance_id)
+    
     def _check_dependencies(self, config: ServiceConfig) -> bool:
         """Check if service dependencies are satisfied."""
         for dep_type in config.dependencies:
@@ -284,40 +389,131 @@ class ServiceManager:
         
         return True
     
-    def _monitor_services(self):
+    async def _monitor_services(self):
         """Monitor service health and perform auto-restart if needed."""
+        self._monitor_loop = asyncio.get_running_loop()
+        self._monitor_wakeup = asyncio.Event()
+        
         while self.running:
+            # Cleared before reading the schedule so later additions wake the wait below
+            self._monitor_wakeup.clear()
             try:
+                now = time.monotonic()
+                due = []
                 with self.lock:
-                    for instance_id, instance in self.services.items():
-                        if instance.status == ServiceStatus.RUNNING:
-                            # Perform health check
-                            is_healthy = self._health_check(instance)
-                            
-                            if not is_healthy:
-                                instance.error_count += 1
-                                instance.health_status = "unhealthy"
-                                
-                                # Auto-restart if configured and error count is reasonable
-                                if (instance.config.auto_restart and 
-                                    instance.error_count < 5):
-                                    logger.warning(f"Auto-restarting unhealthy service {instance_id}")
-                                    threading.Thread(
-                                        target=self.restart_service, 
-                                        args=(instance_id,), 
-                                        daemon=True
-                                    ).start()
-                            else:
-                                instance.health_status = "healthy"
-                                instance.error_count = max(0, instance.error_count - 1)
-                            
-                            instance.last_health_check = datetime.now()
+                    heap = self._hc_heap
+                    while heap and heap[0][0] <= now:
+                        due_at, instance_id = heapq.heappop(heap)
+                        instance = self.services.get(instance_id)
+                        if (self._hc_due.get(instance_id) == due_at and instance is not None and
+                                instance.status == ServiceStatus.RUNNING):
+                            # Unscheduled while in flight; the probe reschedules it
+                            del self._hc_due[instance_id]
+                            due.append((instance_id, instance))
+                
+                # Each probe applies its own result, so a hung one cannot hold back the rest
+                for instance_id, instance in due:
+                    task = asyncio.ensure_future(self._run_health_check(instance_id, instance, now))
+                    self._hc_tasks.add(task)
+                    task.add_done_callback(self._hc_tasks.discard)
                 
-                time.sleep(10)  # Check every 10 seconds
+                # Sleep until the next due check, or until a new one is scheduled
+                with self.lock:
+                    delay = max(0.0, self._hc_heap[0][0] - time.monotonic()) if self._hc_heap else None
                 
             except Exception as e:
                 logger.error(f"Error in service monitoring: {e}")
-                time.sleep(5)
+                delay = 5
+            
+            if not self.running:
+                break
+            try:
+                await asyncio.wait_for(self._monitor_wakeup.wait(), timeout=delay)
+            except asyncio.TimeoutError:
+                pass
+        
+        self._monitor_loop = self._monitor_wakeup = None
+    
+    async def _run_health_check(self, instance_id: str, instance: ServiceInstance,
+                                started_at: float):
+        """Probe one instance and apply the verdict as soon as it completes."""
+        try:
+            is_healthy = await self._health_check_async(instance)
+            # Scheduling uses monotonic time; the wall clock is kept for display only
+            checked_at = datetime.now()
+            
+            lock = self._instance_lock(instance_id)
+            if lock is None:
+                return
+            
+            with lock:
+                # Skip services unregistered, stopped or rescheduled while being checked
+                if (self.services.get(instance_id) is not instance or
+                        instance.status != ServiceStatus.RUNNING or
+                        instance_id in self._hc_due):
+                    return
+                
+                self._schedule_health_check(
+                    instance_id, started_at + self._health_check_period(instance))
+                if not is_healthy:
+                    instance.error_count += 1
+                    instance.health_status = "unhealthy"
+                    
+                    # Auto-restart if configured and error count is reasonable
+                    if (instance.config.auto_restart and 
+                        instance.error_count < 5):
+                        logger.warning(f"Auto-restarting unhealthy service {instance_id}")
+                        self._restart_pool.submit(self.restart_service, instance_id)
+                else:
+                    instance.health_status = "healthy"
+                    instance.error_count = max(0, instance.error_count - 1)
+                self._update_health_index(instance_id, instance)
+                
+                instance.last_health_check = checked_at
+        except Exception as e:
+            logger.error(f"Error checking service {instance_id}: {e}")
+    
+    @staticmethod
+    def _health_check_period(instance: ServiceInstance) -> float:
+        """Seconds between checks of an instance, never below the monitor's floor."""
+        return max(instance.config.health_check_interval, _MIN_HEALTH_CHECK_INTERVAL)
+    
+    def _wake_monitor(self):
+        """Wake the monitor task from any thread."""
+        loop, wakeup = self._monitor_loop, self._monitor_wakeup
+        if loop is not None and wakeup is not None:
+            try:
+                loop.call_soon_threadsafe(wakeup.set)
+            except RuntimeError:
+                pass  # Loop already closed
+    
+    def _schedule_health_check(self, instance_id: str, due_at: float):
+        """Schedule the next health check of an instance, replacing any pending one."""
+        with self.lock:
+            self._hc_due[instance_id] = due_at
+            heapq.heappush(self._hc_heap, (due_at, instance_id))
+            
+            # Drop superseded entries once they outnumber the live ones
+            if len(self._hc_heap) > 2 * len(self._hc_due) + 16:
+                self._hc_heap = [(due, registered_id) for registered_id, due in self._hc_due.items()]
+                heapq.heapify(self._hc_heap)
+        
+        self._wake_monitor()
+    
+    async def _health_check_async(self, instance: ServiceInstance) -> bool:
+        """Perform a health check without blocking the monitor loop."""
+        # A native async probe would await the HTTP request here instead of using the pool
+        loop = asyncio.get_running_loop()
+        try:
+            # A probe never outlives the interval, so checks cannot pile up
+            timeout = min(instance.config.health_check_timeout,
+                          self._health_check_period(instance))
+            return await asyncio.wait_for(
+                loop.run_in_executor(self._hc_pool, self._health_check, instance),
+                timeout=timeout)
+        except asyncio.TimeoutError:
+            logger.warning(f"Health check timed out for service {instance.config.instance_id}")
+            return False
     
     def _health_check(self, instance: ServiceInstance) -> bool:
         """Perform health check on a service instance."""
@@ -327,12 +523,38 @@ class ServiceManager:
         # 3. Verify resource usage is within limits
         # 4. Check response time
         
+        # Probes should go through a client owned by the manager so connections
+        # are kept alive across checks, and be released in close()
+        
         # For simulation, randomly return health status
         import random
         return random.random() > 0.1  # 90% healthy
     
+    def _update_health_index(self, instance_id: str, instance: ServiceInstance,
+                             healthy: Optional[bool] = None):
+        """Add or remove an instance in the healthy index after its state changes."""
+        if healthy is None:
+            healthy = (instance.status == ServiceStatus.RUNNING and
+                       instance.health_status == "healthy")
+        
+        service_type = instance.config.service_type
+        with self.lock:
+            current = self._healthy_by_type[service_type]
+            if healthy == (instance_id in current):
+                return
+            updated = dict(current)
+            if healthy:
+                updated[instance_id] = instance
+            else:
+                del updated[instance_id]
+            self._healthy_by_type[service_type] = updated
+    
     def _notify_status_change(self, instance_id: str, status: ServiceStatus):
         """Notify registered callbacks of status changes."""
+        instance = self.services.get(instance_id)
+        if instance is not None:
+            self._update_health_index(instance_id, instance)
+        
         for callback in self.status_callbacks:
             try:
                 callback(instance_id, status)
@@ -0,0 +1,16 @@
+"""
+Shared test configuration.
+"""
+
+import os
+import sys
+
+# Run numba-decorated helpers as plain Python so unit tests, and coverage runs in
+# particular, do not pay JIT compilation; set NUMBA_DISABLE_JIT=0 to test compiled code
+os.environ.setdefault("NUMBA_DISABLE_JIT", "1")
+
+# Tests import the package as ``src.*``; make the repository root importable once
+# so plain ``pytest`` behaves like ``python -m pytest`` run from the root
+_REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _REPO_ROOT not in sys.path:
+    sys.path.insert(0, _REPO_ROOT)
@@ -4,6 +4,7 @@ Tests for GitHub Actions episode processor.
 
 import unittest
 import tempfile
+import json
 import os
 from pathlib import Path
 from unittest.mock import patch, Mock
@@ -14,6 +15,15 @@ sys.path.append('/home/runner/work/cogprime/cogprime/.github/scripts')
 
 from generate_episode_issues import EpisodeProcessor
 
+def _mock_response(payload, status_code=200, headers=None):
+    """Build a mock requests.Response carrying a JSON payload."""
+    response = Mock(status_code=status_code, headers=headers or {})
+    response.ok = status_code < 400
+    response.content = json.dumps(payload).encode('utf-8')
+    response.json.return_value = payload
+    response.raise_for_status.return_value = None
+    return response
+
 class TestEpisodeProcessor(unittest.TestCase):
     """Test cases for EpisodeProcessor."""
     
@@ -29,10 +39,21 @@ class TestEpisodeProcessor(unittest.TestCase):
         self.env_patcher.start()
         
         self.processor = EpisodeProcessor()
+        
+        # Keep the issue list cache out of the working tree
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.processor.cache_path = Path(self.cache_dir.name) / 'issues_cache.json'
     
     def tearDown(self):
         """Clean up after tests."""
         self.env_patcher.stop()
+        self.cache_dir.cleanup()
+    
+    def _patch_session(self, method: str) -> Mock:
+        """Patch an HTTP method on the processor's session for one test."""
+        patcher = patch.object(self.processor.session, method)
+        self.addCleanup(patcher.stop)
+        return patcher.start()
     
     def test_parse_episode_range_all(self):
         """Test parsing 'all' episode range."""
@@ -156,48 +177,77 @@ More content here.
         self.assertIn('Discussion Points', body)
         self.assertIn('automatically generated', body)
     
-    @patch('generate_episode_issues.requests.get')
-    def test_check_issue_exists_true(self, mock_get):
+    def test_check_issue_exists_true(self):
         """Test checking if issue exists (returns True)."""
+        mock_get = self._patch_session('get')
+        
         # Mock API response with existing issue
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = _mock_response([
             {'title': 'Episode Discussion: Episode 1: Introduction'}
-        ]
-        mock_response.raise_for_status.return_value = None
+        ])
         mock_get.return_value = mock_response
         
         result = self.processor.check_issue_exists('Episode Discussion: Episode 1: Introduction')
         self.assertTrue(result)
     
-    @patch('generate_episode_issues.requests.get')
-    def test_check_issue_exists_false(self, mock_get):
+    def test_check_issue_exists_false(self):
         """Test checking if issue exists (returns False)."""
+        mock_get = self._patch_session('get')
+        
         # Mock API response with no matching issues
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = _mock_response([
             {'title': 'Episode Discussion: Episode 2: Different Title'}
-        ]
-        mock_response.raise_for_status.return_value = None
+        ])
         mock_get.return_value = mock_response
         
         result = self.processor.check_issue_exists('Episode Discussion: Episode 1: Introduction')
         self.assertFalse(result)
     
-    @patch('generate_episode_issues.requests.post')
-    @patch('generate_episode_issues.requests.get')
-    def test_create_github_issue_success(self, mock_get, mock_post):
+    def test_load_existing_titles_paginates(self):
+        """Test that existing titles are fetched across pages and cached."""
+        mock_get = self._patch_session('get')
+        
+        full_page = _mock_response([{'title': f'Issue {i}'} for i in range(100)])
+        last_page = _mock_response([{'title': 'Episode Discussion: Episode 1: Introduction '}])
+        mock_get.side_effect = [full_page, last_page]
+        
+        self.assertTrue(self.processor.check_issue_exists('Episode Discussion: Episode 1: Introduction'))
+        self.assertTrue(self.processor.check_issue_exists('Issue 42'))
+        self.assertFalse(self.processor.check_issue_exists('Issue 100'))
+        
+        # Both pages fetched once, later lookups served from the cache
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertEqual(mock_get.call_args_list[1][1]['params']['page'], 2)
+    
+    def test_load_existing_titles_revalidates_cache(self):
+        """Test that a second run reuses cached titles on 304 Not Modified."""
+        mock_get = self._patch_session('get')
+        mock_get.return_value = _mock_response(
+            [{'title': 'Episode Discussion: Episode 1: Introduction'}],
+            headers={'ETag': '"abc"'}
+        )
+        self.processor.check_issue_exists('anything')
+        
+        # A fresh processor sharing the cache file sends the stored ETag
+        processor = EpisodeProcessor()
+        processor.cache_path = self.processor.cache_path
+        with patch.object(processor.session, 'get') as second_get:
+            second_get.return_value = _mock_response(None, status_code=304, headers={'ETag': '"abc"'})
+            self.assertTrue(processor.check_issue_exists('Episode Discussion: Episode 1: Introduction'))
+        
+        self.assertEqual(second_get.call_args[1]['headers'], {'If-None-Match': '"abc"'})
+    
+    def test_create_github_issue_success(self):
         """Test successful GitHub issue creation."""
+        mock_get = self._patch_session('get')
+        mock_post = self._patch_session('post')
+        
         # Mock check_issue_exists to return False (issue doesn't exist)
-        mock_get_response = Mock()
-        mock_get_response.json.return_value = []
-        mock_get_response.raise_for_status.return_value = None
+        mock_get_response = _mock_response([])
         mock_get.return_value = mock_get_response
         
         # Mock successful issue creation
-        mock_post_response = Mock()
-        mock_post_response.json.return_value = {'number': 123, 'title': 'Test Issue'}
-        mock_post_response.raise_for_status.return_value = None
+        mock_post_response = _mock_response({'number': 123, 'title': 'Test Issue'})
         mock_post.return_value = mock_post_response
         
         episode_data = {
@@ -218,15 +268,61 @@ More content here.
         self.assertIn('body', call_args[1]['json'])
         self.assertIn('labels', call_args[1]['json'])
     
-    @patch('generate_episode_issues.requests.get')
-    def test_create_github_issue_already_exists(self, mock_get):
+    @patch('generate_episode_issues.time.sleep')
+    def test_create_github_issue_retries_after_rate_limit(self, mock_sleep):
+        """Test that a rate-limited POST is retried after Retry-After."""
+        mock_get = self._patch_session('get')
+        mock_post = self._patch_session('post')
+        
+        mock_get_response = _mock_response([])
+        mock_get.return_value = mock_get_response
+        
+        limited_response = _mock_response({}, status_code=403, headers={'retry-after': '2'})
+        created_response = _mock_response({'number': 7}, status_code=201)
+        mock_post.side_effect = [limited_response, created_response]
+        
+        episode_data = {
+            'title': 'Episode 1: Introduction',
+            'summary': 'Test summary',
+            'file_path': 'test/path.md',
+            'sections': [],
+            'concepts': []
+        }
+        
+        self.assertTrue(self.processor.create_github_issue(episode_data))
+        self.assertEqual(mock_post.call_count, 2)
+        self.assertGreater(mock_sleep.call_args[0][0], 1.0)
+    
+    def test_create_github_issue_http_error(self):
+        """Test that a failed POST reports the response body and returns False."""
+        mock_get = self._patch_session('get')
+        mock_post = self._patch_session('post')
+        mock_get.return_value = _mock_response([])
+        mock_post.return_value = _mock_response({'message': 'Validation Failed'}, status_code=422)
+        
+        episode_data = {
+            'title': 'Episode 1: Introduction',
+            'summary': 'Test summary',
+            'file_path': 'test/path.md',
+            'sections': [],
+            'concepts': []
+        }
+        
+        with patch('builtins.print') as mock_print:
+            result = self.processor.create_github_issue(episode_data)
+        
+        self.assertFalse(result)
+        printed = ' '.join(str(call.args[0]) for call in mock_print.call_args_list)
+        self.assertIn('Validation Failed', printed)
+    
+    def test_create_github_issue_already_exists(self):
         """Test GitHub issue creation when issue already exists."""
+        mock_get = self._patch_session('get')
+        
         # Mock check_issue_exists to return True (issue exists)
-        mock_response = Mock()
-        mock_response.json.return_value = [
+        mock_response = _mock_response([
             {'title': 'Episode Discussion: Episode 1: Introduction'}
-        ]
-        mock_response.raise_for_status.return_value = None
+        ])
         mock_get.return_value = mock_response
         
         episode_data = {
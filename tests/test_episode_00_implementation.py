@@ -1,11 +1,6 @@
 """Test for enhanced RelevanceCore with meaning crisis detection."""
 
 import pytest
-import sys
-import os
-
-# Add src to path for imports
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 from src.vervaeke.relevance_core import RelevanceCore, RelevanceMode
 
@@ -55,9 +50,8 @@ class TestRelevanceCoreEnhanced:
         query = {'item1', 'item2'}
         
         # Make multiple evaluations to build history
-        for i in range(5):
-            context = {'test_run': i}
-            self.relevance_core.evaluate_relevance(query, context)
+        contexts = [{'test_run': i} for i in range(5)]
+        self.relevance_core.evaluate_relevance_many(query, contexts)
         
         # Check that history is being tracked
         assert len(self.relevance_core.relevance_history) == 5
@@ -75,9 +69,11 @@ class TestRelevanceCoreEnhanced:
         suggestions = self.relevance_core.get_crisis_intervention_suggestions()
         
         assert len(suggestions) > 0
-        assert any("disconnection" in suggestion.lower() for suggestion in suggestions)
-        assert any("truth-seeking" in suggestion.lower() or "aletheia" in suggestion.lower() 
-                  for suggestion in suggestions)
+        
+        # Lowercase once; the newline separator keeps matches within one suggestion
+        text = "\n".join(suggestions).lower()
+        assert "disconnection" in text
+        assert "truth-seeking" in text or "aletheia" in text
     
     def test_historical_continuity_tracking(self):
         """Test historical continuity assessment."""
@@ -105,8 +101,7 @@ class TestRelevanceCoreEnhanced:
         }
         
         # Make multiple evaluations with inconsistent results
-        for i in range(10):
-            self.relevance_core.evaluate_relevance(query, context)
+        self.relevance_core.evaluate_relevance_many(query, [context] * 10)
         
         # Manually set disconnection to trigger crisis
         self.relevance_core.crisis_indicators.disconnection_level = 0.7
@@ -120,7 +115,7 @@ class TestRelevanceCoreEnhanced:
         assert indicators['historical_disconnect'] > 0.5
         
         # Should provide comprehensive intervention suggestions
-        suggestions = self.relevance_core.get_crisis_intervention_suggestions()
+        suggestions = self.relevance_core.get_crisis_intervention_suggestions(indicators=indicators)
         assert len(suggestions) >= 4  # Multiple intervention types
 
 
@@ -0,0 +1,77 @@
+"""
+Tests for VM-Daemon-Sys cognitive daemon.
+"""
+
+import asyncio
+import os
+import signal
+import threading
+import unittest
+from unittest.mock import patch
+from src.vm_daemon_sys.daemon import CognitiveDaemon
+from src.vm_daemon_sys.service_manager import ServiceManager, ServiceStatus
+
+@unittest.skipUnless(os.name == 'posix', "requires POSIX signal delivery")
+class TestCognitiveDaemon(unittest.TestCase):
+    """Test cases for CognitiveDaemon."""
+    
+    def test_signal_stops_all_services(self):
+        """Test that SIGTERM tears down every service before start() returns."""
+        daemon = CognitiveDaemon()
+        
+        async def run_and_signal():
+            start = asyncio.ensure_future(daemon.start())
+            while not daemon.running:
+                self.assertFalse(start.done())
+                await asyncio.sleep(0.01)
+            
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.wait_for(start, timeout=10)
+        
+        # Healthy checks keep dependency-ordered startup fast and deterministic
+        with patch.object(ServiceManager, '_health_check', return_value=True):
+            asyncio.run(run_and_signal())
+        
+        services = daemon.service_manager.services
+        self.assertGreater(len(services), 0)
+        for instance in services.values():
+            self.assertEqual(instance.status, ServiceStatus.STOPPED)
+        self.assertFalse(daemon.health_monitor.running)
+    
+    def test_signal_during_startup_stops_daemon(self):
+        """Test that a signal received while services start is not dropped."""
+        daemon = CognitiveDaemon()
+        release = threading.Event()
+        
+        def held_health_check(instance):
+            # Keep the first level unhealthy so startup waits in _wait_until_healthy
+            release.wait(5)
+            return True
+        
+        async def run_and_signal():
+            start = asyncio.ensure_future(daemon.start())
+            while not (daemon.service_manager and any(
+                    instance.status == ServiceStatus.RUNNING
+                    for instance in daemon.service_manager.services.values())):
+                self.assertFalse(start.done())
+                await asyncio.sleep(0.01)
+            self.assertFalse(daemon.running)
+            
+            os.kill(os.getpid(), signal.SIGTERM)
+            await asyncio.sleep(0.1)
+            release.set()
+            await asyncio.wait_for(start, timeout=10)
+        
+        with patch.object(ServiceManager, '_health_check', side_effect=held_health_check):
+            try:
+                asyncio.run(run_and_signal())
+            finally:
+                release.set()
+        
+        self.assertFalse(daemon.running)
+        for instance in daemon.service_manager.services.values():
+            self.assertEqual(instance.status, ServiceStatus.STOPPED)
+        self.assertFalse(daemon.health_monitor.running)
+
+if __name__ == '__main__':
+    unittest.main()
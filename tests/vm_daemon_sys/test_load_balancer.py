@@ -2,21 +2,46 @@
 Tests for VM-Daemon-Sys load balancer.
 """
 
+import time
 import unittest
-from unittest.mock import Mock, MagicMock
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Callable, List
 from src.vm_daemon_sys.load_balancer import (
     LoadBalancer, LoadBalancingStrategy, ServiceMetrics
 )
 from src.vm_daemon_sys.service_manager import (
-    ServiceManager, ServiceConfig, ServiceType, ServiceStatus, ServiceInstance
+    ServiceConfig, ServiceType, ServiceStatus, ServiceInstance
 )
 
+@dataclass
+class StubServiceManager:
+    """Minimal ServiceManager stand-in serving fixed instance lists."""
+    healthy: List[ServiceInstance] = field(default_factory=list)
+    by_type: List[ServiceInstance] = field(default_factory=list)
+    status_callbacks: List[Callable] = field(default_factory=list)
+    
+    def get_healthy_services(self, service_type: ServiceType) -> List[ServiceInstance]:
+        return self.healthy
+    
+    def get_services_by_type(self, service_type: ServiceType) -> List[ServiceInstance]:
+        return self.by_type
+    
+    def add_status_callback(self, callback: Callable):
+        self.status_callbacks.append(callback)
+
+@lru_cache(maxsize=None)
+def _mock_instance(instance_id: str, service_type: ServiceType) -> ServiceInstance:
+    """Create a running service instance, shared by tests that only read it."""
+    config = ServiceConfig(service_type=service_type, instance_id=instance_id)
+    return ServiceInstance(config=config, status=ServiceStatus.RUNNING)
+
 class TestLoadBalancer(unittest.TestCase):
     """Test cases for LoadBalancer."""
     
     def setUp(self):
         """Set up test fixtures."""
-        self.service_manager = Mock(spec=ServiceManager)
+        self.service_manager = StubServiceManager()
         self.load_balancer = LoadBalancer(
             strategy=LoadBalancingStrategy.ROUND_ROBIN,
             service_manager=self.service_manager
@@ -31,7 +56,7 @@ class TestLoadBalancer(unittest.TestCase):
             self._create_mock_instance("instance_3", ServiceType.RELEVANCE)
         ]
         
-        self.service_manager.get_healthy_services.return_value = instances
+        self.service_manager.healthy = instances
         
         # Test round robin behavior
         selections = []
@@ -42,6 +67,46 @@ class TestLoadBalancer(unittest.TestCase):
         expected = ["instance_1", "instance_2", "instance_3", "instance_1", "instance_2", "instance_3"]
         self.assertEqual(selections, expected)
     
+    def test_weighted_round_robin_selection(self):
+        """Test weighted round robin load balancing."""
+        self.load_balancer.strategy = LoadBalancingStrategy.WEIGHTED_ROUND_ROBIN
+        
+        instances = [
+            self._create_mock_instance("instance_1", ServiceType.RELEVANCE),
+            self._create_mock_instance("instance_2", ServiceType.RELEVANCE)
+        ]
+        
+        self.service_manager.healthy = instances
+        self.load_balancer.weights = {"instance_1": 0.3, "instance_2": 0.1}
+        
+        selections = [
+            self.load_balancer.select_service_instance(ServiceType.RELEVANCE)
+            for _ in range(8)
+        ]
+        
+        # Weights 3:1 give three turns to instance_1 for each turn of instance_2
+        self.assertEqual(selections.count("instance_1"), 6)
+        self.assertEqual(selections.count("instance_2"), 2)
+    
+    def test_weighted_random_selection(self):
+        """Test weighted random load balancing."""
+        self.load_balancer.strategy = LoadBalancingStrategy.WEIGHTED_RANDOM
+        
+        instances = [
+            self._create_mock_instance("instance_1", ServiceType.WISDOM),
+            self._create_mock_instance("instance_2", ServiceType.WISDOM)
+        ]
+        
+        self.service_manager.healthy = instances
+        self.load_balancer.weights = {"instance_1": 1.0, "instance_2": 0.0}
+        
+        # A zero weight is never picked
+        selections = {
+            self.load_balancer.select_service_instance(ServiceType.WISDOM)
+            for _ in range(20)
+        }
+        self.assertEqual(selections, {"instance_1"})
+    
     def test_least_connections_selection(self):
         """Test least connections load balancing."""
         self.load_balancer.strategy = LoadBalancingStrategy.LEAST_CONNECTIONS
@@ -53,7 +118,7 @@ class TestLoadBalancer(unittest.TestCase):
             self._create_mock_instance("instance_3", ServiceType.WISDOM)
         ]
         
-        self.service_manager.get_healthy_services.return_value = instances
+        self.service_manager.healthy = instances
         
         # Set up metrics with different connection counts
         self.load_balancer.metrics = {
@@ -74,7 +139,7 @@ class TestLoadBalancer(unittest.TestCase):
             self._create_mock_instance("instance_2", ServiceType.INTEGRATION)
         ]
         
-        self.service_manager.get_healthy_services.return_value = instances
+        self.service_manager.healthy = instances
         
         # Set up metrics favoring instance_2
         self.load_balancer.metrics = {
@@ -132,11 +197,65 @@ class TestLoadBalancer(unittest.TestCase):
         self.load_balancer.record_request_end(instance_id, 200.0, success=True)
         self.assertEqual(metrics.current_connections, 0)
         self.assertEqual(metrics.total_requests, 1)
-        self.assertAlmostEqual(metrics.average_response_time, 20.0, places=1)  # Exponential moving average
+        self.assertAlmostEqual(metrics.average_response_time, 20.0, delta=0.05)  # Exponential moving average
+    
+    def test_record_batch(self):
+        """Test recording several request completions at once."""
+        for instance_id in ("instance_1", "instance_2"):
+            self.load_balancer.record_request_start(instance_id)
+        
+        self.load_balancer.record_batch([
+            ("instance_1", 200.0, True),
+            ("instance_2", 100.0, False),
+            ("unknown_instance", 50.0, True)
+        ])
+        
+        first = self.load_balancer.metrics["instance_1"]
+        second = self.load_balancer.metrics["instance_2"]
+        self.assertEqual(first.current_connections, 0)
+        self.assertEqual(first.total_requests, 1)
+        self.assertAlmostEqual(first.average_response_time, 20.0, delta=0.05)
+        self.assertAlmostEqual(second.error_rate, 0.1, delta=0.0005)
+        self.assertNotIn("unknown_instance", self.load_balancer.metrics)
+    
+    def test_record_request_end_many(self):
+        """Test recording many completions for one instance at once."""
+        response_times = [float(50 + (i * 37) % 400) for i in range(100)]
+        successes = [i % 7 != 0 for i in range(100)]
+        
+        for instance_id in ("batched", "sequential"):
+            for _ in range(3):
+                self.load_balancer.record_request_start(instance_id)
+        
+        self.load_balancer.record_request_end_many("batched", response_times, successes)
+        for response_time, success in zip(response_times, successes):
+            self.load_balancer.record_request_end("sequential", response_time, success)
+        
+        batched = self.load_balancer.metrics["batched"]
+        sequential = self.load_balancer.metrics["sequential"]
+        self.assertEqual(batched.current_connections, 0)
+        self.assertEqual(batched.total_requests, 100)
+        self.assertAlmostEqual(batched.average_response_time,
+                               sequential.average_response_time, delta=1e-9)
+        self.assertAlmostEqual(batched.error_rate, sequential.error_rate, delta=1e-12)
+    
+    def test_metrics_created_on_service_start(self):
+        """Test metrics are pre-created when an instance starts."""
+        callback, = self.service_manager.status_callbacks
+        
+        callback("instance_1", ServiceStatus.STARTING)
+        metrics = self.load_balancer.metrics["instance_1"]
+        
+        # A repeated event must not replace the existing metrics
+        callback("instance_1", ServiceStatus.STARTING)
+        self.load_balancer.record_request_start("instance_1")
+        
+        self.assertIs(self.load_balancer.metrics["instance_1"], metrics)
+        self.assertEqual(metrics.current_connections, 1)
     
     def test_no_healthy_instances(self):
         """Test behavior when no healthy instances are available."""
-        self.service_manager.get_healthy_services.return_value = []
+        self.service_manager.healthy = []
         
         selected = self.load_balancer.select_service_instance(ServiceType.RATIONALITY)
         self.assertIsNone(selected)
@@ -144,7 +263,7 @@ class TestLoadBalancer(unittest.TestCase):
     def test_single_instance(self):
         """Test behavior with single instance."""
         instance = self._create_mock_instance("only_instance", ServiceType.PHENOMENOLOGY)
-        self.service_manager.get_healthy_services.return_value = [instance]
+        self.service_manager.healthy = [instance]
         
         selected = self.load_balancer.select_service_instance(ServiceType.PHENOMENOLOGY)
         self.assertEqual(selected, "only_instance")
@@ -156,10 +275,13 @@ class TestLoadBalancer(unittest.TestCase):
             current_connections=5,
             average_response_time=200.0,
             error_rate=0.03,
-            cognitive_load=0.5
+            cognitive_load=0.5,
+            last_updated=time.time()
         )
+        self.load_balancer.metrics = {"test_instance": metrics}
         
-        weight = self.load_balancer._calculate_instance_weight(metrics)
+        self.load_balancer.update_service_weights()
+        weight = self.load_balancer.weights["test_instance"]
         
         # Weight should be positive and less than 1.0 due to penalties
         self.assertGreater(weight, 0.0)
@@ -172,7 +294,7 @@ class TestLoadBalancer(unittest.TestCase):
             self._create_mock_instance("instance_2", ServiceType.MEANING_MAKING)
         ]
         
-        self.service_manager.get_services_by_type.return_value = instances
+        self.service_manager.by_type = instances
         
         # Set up metrics
         self.load_balancer.metrics = {
@@ -182,14 +304,12 @@ class TestLoadBalancer(unittest.TestCase):
         
         distribution = self.load_balancer.get_load_distribution(ServiceType.MEANING_MAKING)
         
-        self.assertAlmostEqual(distribution["instance_1"], 80.0, places=1)
-        self.assertAlmostEqual(distribution["instance_2"], 20.0, places=1)
+        self.assertAlmostEqual(distribution["instance_1"], 80.0, delta=0.05)
+        self.assertAlmostEqual(distribution["instance_2"], 20.0, delta=0.05)
     
     def _create_mock_instance(self, instance_id: str, service_type: ServiceType):
         """Create a mock service instance."""
-        config = ServiceConfig(service_type=service_type, instance_id=instance_id)
-        instance = ServiceInstance(config=config, status=ServiceStatus.RUNNING)
-        return instance
+        return _mock_instance(instance_id, service_type)
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
@@ -5,6 +5,7 @@ Tests for VM-Daemon-Sys service manager.
 import unittest
 import threading
 import time
+from unittest.mock import patch
 from src.vm_daemon_sys.service_manager import (
     ServiceManager, ServiceConfig, ServiceType, ServiceStatus
 )
@@ -12,14 +13,23 @@ from src.vm_daemon_sys.service_manager import (
 class TestServiceManager(unittest.TestCase):
     """Test cases for ServiceManager."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.service_manager = ServiceManager()
+    @classmethod
+    def setUpClass(cls):
+        """Set up one service manager shared by all tests."""
+        cls.service_manager = ServiceManager()
+    
+    @classmethod
+    def tearDownClass(cls):
+        """Release the shared service manager."""
+        cls.service_manager.close()
     
     def tearDown(self):
         """Clean up after tests."""
-        if self.service_manager:
-            self.service_manager.stop_monitoring()
+        self.service_manager.stop_monitoring()
+        
+        # Leave the shared manager empty for the next test
+        for instance_id in list(self.service_manager.services):
+            self.service_manager.unregister_service(instance_id)
     
     def test_register_service(self):
         """Test service registration."""
@@ -88,6 +98,38 @@ class TestServiceManager(unittest.TestCase):
         self.assertEqual(len(relevance_services), 2)
         self.assertEqual(len(wisdom_services), 1)
     
+    def test_snapshot_by_type(self):
+        """Test grouping all services by type in one call."""
+        configs = [
+            ServiceConfig(service_type=ServiceType.RELEVANCE, port=8100),
+            ServiceConfig(service_type=ServiceType.RELEVANCE, port=8101),
+            ServiceConfig(service_type=ServiceType.WISDOM, port=8200)
+        ]
+        
+        for config in configs:
+            self.service_manager.register_service(config)
+        
+        snapshot = self.service_manager.snapshot_by_type()
+        
+        self.assertEqual(set(snapshot), set(ServiceType))
+        self.assertEqual(len(snapshot[ServiceType.RELEVANCE]), 2)
+        self.assertEqual(len(snapshot[ServiceType.WISDOM]), 1)
+        self.assertEqual(snapshot[ServiceType.INTEGRATION], [])
+    
+    def test_get_metrics_batch(self):
+        """Test fetching metrics for several services at once."""
+        first = self.service_manager.register_service(
+            ServiceConfig(service_type=ServiceType.RELEVANCE, port=8100))
+        second = self.service_manager.register_service(
+            ServiceConfig(service_type=ServiceType.WISDOM, port=8200))
+        self.service_manager.services[first].metrics['cpu_usage'] = 42.0
+        
+        batch = self.service_manager.get_metrics_batch([first, second, "nonexistent"])
+        
+        self.assertEqual(batch, {first: {'cpu_usage': 42.0}, second: {}})
+        batch[first]['cpu_usage'] = 0.0
+        self.assertEqual(self.service_manager.services[first].metrics['cpu_usage'], 42.0)
+    
     def test_dependency_checking(self):
         """Test dependency checking."""
         # Create service with dependencies
@@ -109,16 +151,20 @@ class TestServiceManager(unittest.TestCase):
             ServiceConfig(service_type=ServiceType.WISDOM, port=8200)
         ]
         
-        for dep_config in dep_configs:
-            dep_id = self.service_manager.register_service(dep_config)
-            self.service_manager.start_service(dep_id)
-        
-        # Wait for services to be marked as healthy
-        time.sleep(0.1)
-        
-        # Now should succeed
-        success = self.service_manager.start_service(instance_id)
-        self.assertTrue(success)
+        # Dependencies count once the monitor has marked them healthy
+        with patch.object(self.service_manager, '_health_check', return_value=True):
+            self.service_manager.start_monitoring()
+            for dep_config in dep_configs:
+                dep_id = self.service_manager.register_service(dep_config)
+                self.service_manager.start_service(dep_id)
+            
+            self._wait_for(lambda: all(
+                self.service_manager.get_healthy_services(dep_config.service_type)
+                for dep_config in dep_configs), timeout=5.0)
+            
+            # Now should succeed
+            success = self.service_manager.start_service(instance_id)
+            self.assertTrue(success)
     
     def test_service_monitoring(self):
         """Test service monitoring functionality."""
@@ -133,14 +179,48 @@ class TestServiceManager(unittest.TestCase):
         # Start monitoring
         self.service_manager.start_monitoring()
         
-        # Wait a bit for monitoring to run
-        time.sleep(0.5)
+        # Wait for the first health check to run
+        instance = self.service_manager.services[instance_id]
+        self._wait_for(lambda: instance.last_health_check is not None)
         
         # Check that service is being monitored
-        instance = self.service_manager.services[instance_id]
         self.assertIsNotNone(instance.last_health_check)
         
         self.service_manager.stop_monitoring()
+    
+    def test_hung_health_check_does_not_delay_others(self):
+        """Test that one stuck probe does not hold back other services' checks."""
+        hung_id = self.service_manager.register_service(
+            ServiceConfig(service_type=ServiceType.RELEVANCE, port=8100))
+        other_id = self.service_manager.register_service(
+            ServiceConfig(service_type=ServiceType.WISDOM, port=8200))
+        release = threading.Event()
+        
+        def health_check(instance):
+            if instance.config.instance_id == hung_id:
+                release.wait(5)
+            return True
+        
+        with patch.object(self.service_manager, '_health_check', side_effect=health_check):
+            try:
+                self.service_manager.start_monitoring()
+                self.service_manager.start_service(hung_id)
+                self.service_manager.start_service(other_id)
+                
+                other = self.service_manager.services[other_id]
+                self._wait_for(lambda: other.health_status == "healthy")
+                self.assertEqual(self.service_manager.services[hung_id].health_status, "unknown")
+            finally:
+                release.set()
+                self.service_manager.stop_monitoring()
+    
+    def _wait_for(self, condition, timeout: float = 1.0):
+        """Poll until condition() is true, failing the test if the timeout expires."""
+        deadline = time.monotonic() + timeout
+        while not condition():
+            if time.monotonic() >= deadline:
+                self.fail(f"condition not met within {timeout}s")
+            time.sleep(0.001)
 
 class TestServiceConfig(unittest.TestCase):
     """Test cases for ServiceConfig."""
@@ -156,6 +236,7 @@ class TestServiceConfig(unittest.TestCase):
         self.assertEqual(config.cpu_limit, 1.0)
         self.assertTrue(config.auto_restart)
         self.assertEqual(config.health_check_interval, 30)
+        self.assertEqual(config.health_check_timeout, 10)
     
     def test_custom_values(self):
         """Test custom configuration values."""